@@ -3,12 +3,18 @@ from datetime import datetime
 from airflow.operators.python import PythonOperator
 from db.mongodb import connect_to_mongo
 from airflow.sync_setting_computers import sync_setting_computers
+from airflow.rebuild_setting_summary import rebuild_setting_summary
 
 
 def send_reminder_task():
     connect_to_mongo()
     sync_setting_computers()
 
+
+def rebuild_summary_task():
+    connect_to_mongo()
+    rebuild_setting_summary()
+
 with DAG(
     dag_id="sync_setting_dashboard",
     start_date=datetime(2024, 1, 1),
@@ -20,4 +26,17 @@ with DAG(
     send_reminder = PythonOperator(
         task_id="sync_setting_dashboard",
         python_callable=send_reminder_task,
-    )
\ No newline at end of file
+    )
+
+with DAG(
+    dag_id="rebuild_setting_summary",
+    start_date=datetime(2024, 1, 1),
+    schedule_interval="0 3 * * *",
+    catchup=False,
+    tags=["setting"],
+) as summary_dag:
+
+    rebuild_summary = PythonOperator(
+        task_id="rebuild_setting_summary",
+        python_callable=rebuild_summary_task,
+    )
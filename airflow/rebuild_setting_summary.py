@@ -0,0 +1,16 @@
+from services.setting_summary import SettingSummaryService
+
+
+def rebuild_setting_summary():
+    """
+    Setting 건수 요약 문서 전체 재계산
+    - 쓰기 경로의 $inc 갱신이 동시 변경 등으로 어긋난 경우 바로잡기 위함
+    """
+    return SettingSummaryService.rebuild()
+
+
+if __name__ == "__main__":
+    from db.mongodb import connect_to_mongo
+
+    connect_to_mongo()
+    print(rebuild_setting_summary())
@@ -1,61 +1,276 @@
-from datetime import datetime
+import os
+import socket
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+from mongoengine import Q
 from models.computer import Computer, ComputerStatus
 from models.setting import Setting
-from models.employee import Employee
+from models.sync_state import SyncState
+from services.collection_version import CollectionVersionService
+from services.employee import employee_cache
 from services.setting import SettingService
+from services.setting_events import EventType, publish_local
+from services.setting_summary import SettingSummaryService
 
 
-def sync_setting_computers():
+SYNC_NAME = "setting_computers"
+
+# 마지막 전체 동기화 후 이 시간이 지나면 증분 대신 전체 동기화 실행
+# (updated_at이 늦게 기록된 장비 등 증분 동기화에서 놓친 변경을 바로잡기 위함)
+FULL_RECONCILE_HOURS = int(os.getenv("SYNC_FULL_RECONCILE_HOURS", "24"))
+
+# Setting 생성에 필요한 장비 필드만 조회
+COMPUTER_FIELDS = ("user_name", "user_email", "os", "model", "serial", "device_type", "network_type")
+
+# 워터마크를 이 시간만큼 늦춰 기록 (스캔 중에 커밋된 변경 / 서버 간 시계 차이로 updated_at이 과거인 변경 대비)
+# 다음 증분 동기화에서 일부 장비를 다시 확인하지만 생성 / 삭제는 중복 실행되어도 결과가 같음
+WATERMARK_SKEW_SECONDS = int(os.getenv("SYNC_WATERMARK_SKEW_SECONDS", "60"))
+
+# 동기화 락 유지 시간 (프로세스가 죽어도 이 시간이 지나면 다른 프로세스가 실행 가능)
+LOCK_SECONDS = int(os.getenv("SYNC_LOCK_SECONDS", "600"))
+
+
+def sync_setting_computers(full: Optional[bool] = None):
     """
     computer.status == SETTING -> setting에 자동 추가
     computer.status == USE -> setting에서 자동 삭제
-    :return:
+
+    - 증분: 마지막 워터마크 이후 updated_at이 바뀐 장비만 확인
+    - 전체: 모든 SETTING / USE 장비 확인 (최초 실행 / FULL_RECONCILE_HOURS 경과 / full=True)
+    :param full: True면 전체, False면 증분, None이면 자동 결정
+    :return: 생성 / 삭제 건수 + 단계별 소요 시간(ms)
     """
-    existing_serials = set(
-        Setting.objects.only("serial").scalar("serial")
-    )
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    if not _acquire_lock(owner):
+        # 다른 워커 / Airflow 태스크가 이미 실행 중
+        return {"mode": "skipped", "reason": "locked"}
+
+    try:
+        return _sync(full)
+    finally:
+        _release_lock(owner)
+
+
+def _sync(full: Optional[bool]):
+    timings = {}
+    started = time.perf_counter()
+
+    state = SyncState.objects(name=SYNC_NAME).first()
+    now = datetime.utcnow()
+
+    if full is None:
+        full = (
+            not state
+            or not state.watermark
+            or not state.last_full_sync_at
+            or now - state.last_full_sync_at >= timedelta(hours=FULL_RECONCILE_HOURS)
+        )
+
+    if full:
+        result = _full_sync(timings)
+    else:
+        result = _incremental_sync(state.watermark, timings)
+
+    # Setting이 바뀐 경우에만 컬렉션 버전 증가 (GET /settings ETag)
+    if result["created"] or result["deleted"]:
+        CollectionVersionService.bump(Setting._get_collection_name())
+        # 개별 변경 대신 목록 재조회 요청 (change stream 사용 시에는 문서별 이벤트로 전달됨)
+        publish_local(EventType.RESYNC, data={"created": result["created"], "deleted": result["deleted"]})
+
+    timings["total"] = _elapsed_ms(started)
+    result["timings_ms"] = timings
+
+    updates = {
+        "set__last_run_at": now,
+        "set__last_result": result,
+    }
+    if result["watermark"]:
+        updates["set__watermark"] = result["watermark"]
+    if full:
+        updates["set__last_full_sync_at"] = now
 
-    target_computers = Computer.objects(status=ComputerStatus.SETTING)
-    created_count = 0
-    deleted_count = 0
+    SyncState.objects(name=SYNC_NAME).update_one(upsert=True, **updates)
 
-    service = SettingService()
+    return result
+
+
+def _full_sync(timings: Dict[str, float]):
+    with _timed(timings, "load"):
+        # 워터마크는 스캔 전에 읽음 - 스캔 중 변경된 장비는 다음 증분 동기화에서 다시 확인
+        scan_started = datetime.utcnow() - timedelta(seconds=WATERMARK_SKEW_SECONDS)
+        latest = Computer.objects.order_by("-updated_at").scalar("updated_at").first()
+        watermark = min(latest, scan_started) if latest else None
+
+        existing_serials = set(
+            Setting.objects.only("serial").scalar("serial")
+        )
+        target_computers = list(
+            Computer.objects(status=ComputerStatus.SETTING).only(*COMPUTER_FIELDS).as_pymongo()
+        )
+        use_serial = set(
+            Computer.objects(status=ComputerStatus.USE).only("serial").scalar("serial")
+        )
 
     # SETTING 추가
-    for computer in target_computers:
-        if computer.serial in existing_serials:
+    with _timed(timings, "create"):
+        created_count, skipped = _create_settings(target_computers, existing_serials)
+
+    # USE 삭제
+    with _timed(timings, "delete"):
+        deleted_count = _delete_settings(existing_serials & use_serial)
+
+    return {
+        "mode": "full",
+        "created": created_count,
+        "deleted": deleted_count,
+        "skipped": skipped,
+        "watermark": watermark,
+    }
+
+
+def _incremental_sync(watermark: datetime, timings: Dict[str, float]):
+    with _timed(timings, "load"):
+        scan_started = datetime.utcnow() - timedelta(seconds=WATERMARK_SKEW_SECONDS)
+
+        # 같은 시각에 기록된 변경을 놓치지 않도록 gte로 조회 (생성 / 삭제는 중복 실행되어도 결과가 같음)
+        changed_computers = list(Computer.objects(
+            updated_at__gte=watermark,
+            status__in=[ComputerStatus.SETTING, ComputerStatus.USE]
+        ).only(*COMPUTER_FIELDS, "status", "updated_at").as_pymongo())
+
+        target_computers = [c for c in changed_computers if c["status"] == ComputerStatus.SETTING.value]
+        use_serial = {c["serial"] for c in changed_computers if c["status"] == ComputerStatus.USE.value}
+
+        existing_serials = set(
+            Setting.objects(serial__in=[c["serial"] for c in target_computers]).scalar("serial")
+        ) if target_computers else set()
+
+    with _timed(timings, "create"):
+        created_count, skipped = _create_settings(target_computers, existing_serials)
+
+    with _timed(timings, "delete"):
+        deleted_count = _delete_settings(use_serial)
+
+    # 스캔 중 커밋된 더 이른 updated_at을 놓치지 않도록 스캔 시작 시각(- skew) 이후로는 올리지 않음
+    latest = max((c["updated_at"] for c in changed_computers if c.get("updated_at")), default=watermark)
+    new_watermark = max(watermark, min(latest, scan_started))
+
+    return {
+        "mode": "incremental",
+        "changed": len(changed_computers),
+        "created": created_count,
+        "deleted": deleted_count,
+        "skipped": skipped,
+        "watermark": new_watermark,
+    }
+
+
+def _create_settings(computers: List[Dict[str, Any]], existing_serials: Set[str]) -> Tuple[int, List[str]]:
+    """
+    새 SETTING 장비를 Setting으로 한 번에 추가
+    - 사용자 정보는 employee_cache로 조회 (캐시에 없는 사용자만 email__in 쿼리 한 번)
+    - insert_many 한 번으로 저장
+    :return: (생성 건수, 사용자 정보가 없어 건너뛴 serial 목록)
+    """
+    new_computers = []
+    for computer in computers:
+        if computer["serial"] in existing_serials:
             continue
+        existing_serials.add(computer["serial"])
+        new_computers.append(computer)
+
+    if not new_computers:
+        return 0, []
+
+    users = employee_cache.get_many_by_email(computer["user_email"] for computer in new_computers)
+
+    requested_date = datetime.utcnow()
+    settings = []
+    skipped = []
 
-        user = Employee.objects(email=computer.user_email).first()
+    for computer in new_computers:
+        user = users.get(computer["user_email"])
+        if not user:
+            skipped.append(computer["serial"])
+            continue
 
-        Setting(
-            user_name=computer.user_name,
-            user_email=computer.user_email,
+        setting = Setting(
+            user_name=computer["user_name"],
+            user_email=computer["user_email"],
             role=user.role,
-            os=computer.os,
-            model=computer.model,
-            serial=computer.serial,
-            device_type=computer.device_type,
-            network_type=computer.network_type,
+            os=computer["os"],
+            model=computer["model"],
+            serial=computer["serial"],
+            device_type=computer["device_type"],
+            network_type=computer["network_type"],
             onboarding_type="pending",
             status="setting",
             company=user.company,
-            requested_date=datetime.utcnow(),
-            quick_actions=service.generate_quick_actions(os=computer.os, onboarding_type="pending")
-        ).save()
+            requested_date=requested_date,
+            quick_actions=SettingService.generate_quick_actions(os=computer["os"], onboarding_type="pending")
+        )
+        setting.validate()
+        settings.append(setting)
 
-        created_count += 1
+    if settings:
+        Setting.objects.insert(settings, load_bulk=False)
+        SettingSummaryService.apply(added=[setting.to_mongo() for setting in settings])
 
-    # USE 삭제
-    use_computers = Computer.objects(status=ComputerStatus.USE)
-    use_serial = {computer.serial for computer in use_computers}
+    return len(settings), skipped
 
-    delete_targets = existing_serials & use_serial
 
-    if delete_targets:
-        deleted_count = Setting.objects(serial__in=list(delete_targets)).delete()
+def _acquire_lock(owner: str) -> bool:
+    now = datetime.utcnow()
 
-    return {
-        "created": created_count,
-        "deleted": deleted_count,
-    }
+    # 상태 문서가 없으면 먼저 생성
+    SyncState.objects(name=SYNC_NAME).update_one(upsert=True, set_on_insert__locked_until=None)
+
+    # 락이 없거나 만료된 경우에만 획득
+    acquired = SyncState.objects(
+        Q(name=SYNC_NAME) & (Q(locked_until=None) | Q(locked_until__lt=now))
+    ).update_one(
+        set__locked_by=owner,
+        set__locked_until=now + timedelta(seconds=LOCK_SECONDS)
+    )
+    return acquired > 0
+
+
+def _release_lock(owner: str):
+    SyncState.objects(name=SYNC_NAME, locked_by=owner).update_one(
+        set__locked_by=None,
+        set__locked_until=None
+    )
+
+
+def _delete_settings(serials: Set[str]) -> int:
+    """
+    삭제 대상의 요약 필드를 먼저 읽어 요약 건수에서 뺀 뒤 같은 _id 목록만 삭제
+    """
+    if not serials:
+        return 0
+
+    targets = list(Setting.objects(serial__in=list(serials)).only(
+        "status", "company", "onboarding_type", "quick_actions"
+    ).as_pymongo())
+    if not targets:
+        return 0
+
+    deleted = Setting.objects(id__in=[doc["_id"] for doc in targets]).delete()
+    SettingSummaryService.apply(removed=targets)
+    return deleted
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = _elapsed_ms(started)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -0,0 +1,88 @@
+"""
+Setting 문서 한 건 직렬화 비용 비교 (DB 연결 없이 실행)
+- document: Document 생성 -> CrudBase._serialize (to_mongo + serialize_mongo)
+- raw: CrudBase raw=True 경로 (as_pymongo 결과 -> serialize_bson)
+
+실행: python -m bench.bench_serialize [-n 반복 횟수]
+"""
+import argparse
+import timeit
+from datetime import datetime
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from common.serializers import serialize_bson
+from models.setting import Setting
+from services.crud_base import CrudBase
+
+
+QUICK_ACTIONS = ("okta-setting", "win-setting", "o365-intune", "password-notice", "pickup-notice", "okta-activate")
+
+
+class SettingCrud(CrudBase):
+    model = Setting
+
+
+def sample_setting():
+    """
+    as_pymongo()로 읽은 것과 같은 형태의 Setting (빠른 실행 6개, 체크리스트 8개)
+    """
+    now = datetime.utcnow()
+    return {
+        "_id": ObjectId(),
+        "user_name": "홍길동",
+        "user_email": "gildong@example.com",
+        "role": "team",
+        "os": "Windows",
+        "model": "X1",
+        "serial": "S123",
+        "device_type": "EDP001",
+        "network_type": "team",
+        "urgency": False,
+        "onboarding_type": "new",
+        "status": "setting",
+        "memo": "memo",
+        "checklist": [{"label": f"item {i}", "checked": False} for i in range(8)],
+        "quick_actions": [
+            {"action": action, "requested_by": "it", "requested_at": now, "status": "done", "error_message": None}
+            for action in QUICK_ACTIONS
+        ],
+        "collaborators": None,
+        "assignee_name": None,
+        "completed_date": None,
+        "is_manual": True,
+        "company": "core",
+        "requested_date": now,
+        "due_date": now,
+        "created_at": now,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Setting 직렬화 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=5000, help="반복 횟수")
+    args = parser.parse_args()
+
+    raw = sample_setting()
+
+    def document():
+        return SettingCrud._serialize(Setting._from_son(raw))
+
+    def bson():
+        return serialize_bson(raw)
+
+    # 두 경로의 API 응답(JSON)이 같은지 먼저 확인
+    assert jsonable_encoder(document()) == jsonable_encoder(bson())
+
+    cases = {
+        "document (_serialize)": document,
+        "raw (serialize_bson)": bson,
+        "document + jsonable_encoder": lambda: jsonable_encoder(document()),
+        "raw + jsonable_encoder": lambda: jsonable_encoder(bson()),
+    }
+    for name, func in cases.items():
+        elapsed = timeit.timeit(func, number=args.number)
+        print(f"{name:<30} {elapsed / args.number * 1e6:8.1f} us/doc")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,93 +1,241 @@
 import json
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List
 from zoneinfo import ZoneInfo
 
-def password_notice_message_block(user_name: str):
-    return [
-		{
-			"type": "header",
-			"text": {
-				"type": "plain_text",
-				"text": "🔐 Okta 비밀번호 자동 초기화 안내",
-				"emoji": True
-			}
-		},
-		{
-			"type": "section",
-			"text": {
-				"type": "mrkdwn",
-				"text": f"{user_name}님, 안녕하세요 :wave: \n장비 세팅을 위해 *Okta 비밀번호가 자동으로 초기화될 예정* 이에요. 초기화가 완료되면 *세팅봇 DM으로 초기화된 비밀번호가 전송* 될 예정이니 확인해주세요."
-			}
-		},
-		{
-			"type": "context",
-			"elements": [
-				{
-					"type": "mrkdwn",
-					"text": "⚠️ 장비 수령 전까지는 *비밀번호를 변경하지 말아주세요*"
-				}
-			]
-		},
-		{
-			"type": "context",
-			"elements": [
-				{
-					"type": "mrkdwn",
-					"text": "문의 사항이 있으면 *IT Manager* 에게 연락해주세요"
-				}
-			]
-		}
-	]
+# 고정 블록은 import 시 한 번만 만들고, 함수는 사용자별로 달라지는 부분만 새로 생성
+# - 반환된 블록 / 뷰는 여러 호출이 공유하므로 수정하지 말 것 (slack_sdk는 수정하지 않음)
 
-def pickup_notice_message_block():
-    return [
+KST = ZoneInfo("Asia/Seoul")
+
+_NO_PASSWORD_CHANGE_CONTEXT = {
+    "type": "context",
+    "elements": [
         {
-            "type": "header",
-            "text": {
-              "type": "plain_text",
-              "text": "📦 장비 수령 안내",
-              "emoji": True
+            "type": "mrkdwn",
+            "text": "⚠️ 장비 수령 전까지는 *비밀번호를 변경하지 말아주세요*"
+        }
+    ]
+}
+
+_PASSWORD_NOTICE_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🔐 Okta 비밀번호 자동 초기화 안내",
+        "emoji": True
+    }
+}
+
+_PASSWORD_NOTICE_TEXT = (
+    "{user_name}님, 안녕하세요 :wave: \n장비 세팅을 위해 *Okta 비밀번호가 자동으로 초기화될 예정* 이에요. "
+    "초기화가 완료되면 *세팅봇 DM으로 초기화된 비밀번호가 전송* 될 예정이니 확인해주세요."
+)
+
+_CONTACT_CONTEXT = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "문의 사항이 있으면 *IT Manager* 에게 연락해주세요"
+        }
+    ]
+}
+
+_PICKUP_NOTICE_BLOCKS = [
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "📦 장비 수령 안내",
+            "emoji": True
+        }
+    },
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "PC 세팅이 완료되어 장비 수령이 가능합니다 🙌\n아래 버튼을 눌러 *수령 희망 시간과 백업 디스크 필요 여부* 를 선택해주세요."
+        }
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": ":warning: 장비는 4층 IT팀에서 수령 가능합니다"
             }
+        ]
+    }
+]
+
+_PICKUP_NOTICE_BUTTON_BLOCKS = [
+    {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "🕒 수령 날짜 및 시간 선택",
+                    "emoji": True
+                },
+                "style": "primary",
+                "action_id": "open_pickup_modal"
+            }
+        ]
+    }
+]
+
+_PICKUP_TIME_BLOCK = {
+    "type": "input",
+    "block_id": "pickup_time_block",
+    "label": {
+        "type": "plain_text",
+        "text": "수령 희망 시간"
+    },
+    "element": {
+        "type": "timepicker",
+        "initial_time": "10:00",
+        "action_id": "pickup_time",
+        "placeholder": {
+            "type": "plain_text",
+            "text": "시간을 선택해주세요"
+        }
+    }
+}
+
+_BACKUP_DISK_NO_OPTION = {
+    "text": {
+        "type": "plain_text",
+        "text": "필요없어요"
+    },
+    "value": "no"
+}
+
+_BACKUP_DISK_BLOCK = {
+    "type": "input",
+    "block_id": "backup_disk_block",
+    "label": {
+        "type": "plain_text",
+        "text": "백업 디스크 필요 여부"
+    },
+    "element": {
+        "type": "static_select",
+        "action_id": "backup_disk",
+        "placeholder": {
+            "type": "plain_text",
+            "text": "선택해주세요"
         },
+        "initial_option": _BACKUP_DISK_NO_OPTION,
+        "options": [
+            _BACKUP_DISK_NO_OPTION,
+            {
+                "text": {
+                    "type": "plain_text",
+                    "text": "필요해요"
+                },
+                "value": "yes"
+            }
+        ]
+    }
+}
+
+_PICKUP_RESERVE_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": ":alarm_clock: 장비 수령 정보 제출됨",
+        "emoji": True
+    }
+}
+
+_PASSWORD_RESET_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🔐 Okta 비밀번호 초기화 완료",
+        "emoji": True
+    }
+}
+
+_PASSWORD_RESET_SECTION = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "장비 세팅을 위해 *Okta 비밀번호가 자동으로 초기화* 되었어요 \n아래 버튼을 눌러 초기화된 비밀번호를 확인해주세요"
+    }
+}
+
+_PASSWORD_BUTTON_TEXT = {
+    "type": "plain_text",
+    "text": "🔑 비밀번호 확인",
+    "emoji": True
+}
+
+_PASSWORD_CHECK_TITLE = {
+    "type": "plain_text",
+    "text": "비밀번호 확인",
+    "emoji": True
+}
+
+_PASSWORD_CHECK_CLOSE = {
+    "type": "plain_text",
+    "text": "닫기"
+}
+
+
+def password_notice_message_block(user_name: str):
+    return [
+        _PASSWORD_NOTICE_HEADER,
         {
             "type": "section",
             "text": {
-              "type": "mrkdwn",
-              "text": "PC 세팅이 완료되어 장비 수령이 가능합니다 🙌\n아래 버튼을 눌러 *수령 희망 시간과 백업 디스크 필요 여부* 를 선택해주세요."
+                "type": "mrkdwn",
+                "text": _PASSWORD_NOTICE_TEXT.format(user_name=user_name)
             }
         },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": ":warning: 장비는 4층 IT팀에서 수령 가능합니다"
-                }
-            ]
-        }
+        _NO_PASSWORD_CHANGE_CONTEXT,
+        _CONTACT_CONTEXT,
     ]
 
+def pickup_notice_message_block():
+    return _PICKUP_NOTICE_BLOCKS
+
 def pickup_notice_button_block():
+    return _PICKUP_NOTICE_BUTTON_BLOCKS
+
+@lru_cache(maxsize=8)
+def _pickup_modal_blocks(initial_date: str) -> List[Dict[str, Any]]:
+    """
+    날짜(KST)별로 한 번만 생성 - 날짜가 바뀌면 새 항목이 만들어지고 지난 날짜는 LRU로 밀려남
+    :param initial_date: YYYY-MM-DD
+    """
     return [
         {
-            "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "🕒 수령 날짜 및 시간 선택",
-                        "emoji": True
-                    },
-                    "style": "primary",
-                    "action_id": "open_pickup_modal"
+            "type": "input",
+            "block_id": "pickup_date_block",
+            "label": {
+                "type": "plain_text",
+                "text": "수령 희망 날짜"
+            },
+            "element": {
+                "type": "datepicker",
+                "initial_date": initial_date,
+                "action_id": "pickup_date",
+                "placeholder": {
+                    "type": "plain_text",
+                    "text": "날짜를 선택해주세요"
                 }
-            ]
-        }
+            }
+        },
+        _PICKUP_TIME_BLOCK,
+        _BACKUP_DISK_BLOCK,
     ]
 
 def pickup_notice_modal_view(channel_id: str, message_ts: str):
-    kst_now = datetime.now(ZoneInfo("Asia/Seoul")).date()
+    kst_now = datetime.now(KST).date()
 
     return {
         "title": {
@@ -109,93 +257,12 @@ def pickup_notice_modal_view(channel_id: str, message_ts: str):
             "type": "plain_text",
             "text": "취소"
         },
-        "blocks": [
-            {
-                "type": "input",
-                "block_id": "pickup_date_block",
-                "label": {
-                    "type": "plain_text",
-                    "text": "수령 희망 날짜"
-                },
-                "element": {
-                    "type": "datepicker",
-                    "initial_date": f"{kst_now}",
-                    "action_id": "pickup_date",
-                    "placeholder": {
-                        "type": "plain_text",
-                        "text": "날짜를 선택해주세요"
-                    }
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "pickup_time_block",
-                "label": {
-                    "type": "plain_text",
-                    "text": "수령 희망 시간"
-                },
-                "element": {
-                    "type": "timepicker",
-                    "initial_time": "10:00",
-                    "action_id": "pickup_time",
-                    "placeholder": {
-                        "type": "plain_text",
-                        "text": "시간을 선택해주세요"
-                    }
-                }
-            },
-            {
-                "type": "input",
-                "block_id": "backup_disk_block",
-                "label": {
-                    "type": "plain_text",
-                    "text": "백업 디스크 필요 여부"
-                },
-                "element": {
-                    "type": "static_select",
-                    "action_id": "backup_disk",
-                    "placeholder": {
-                        "type": "plain_text",
-                        "text": "선택해주세요"
-                    },
-                    "initial_option": {
-                        "text": {
-                            "type": "plain_text",
-                            "text": "필요없어요"
-                        },
-                        "value": "no"
-                    },
-                    "options": [
-                        {
-                            "text": {
-                                "type": "plain_text",
-                                "text": "필요없어요"
-                            },
-                            "value": "no"
-                        },
-                        {
-                            "text": {
-                                "type": "plain_text",
-                                "text": "필요해요"
-                            },
-                            "value": "yes"
-                        }
-                    ]
-                }
-            }
-        ]
+        "blocks": _pickup_modal_blocks(kst_now.isoformat())
     }
 
 def pickup_reserve_message_block(user_slack_id: str, pickup_date: str, pickup_time: str, backup_disk: str):
     return [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": ":alarm_clock: 장비 수령 정보 제출됨",
-                "emoji": True
-            }
-        },
+        _PICKUP_RESERVE_HEADER,
         {
             "type": "section",
             "fields": [
@@ -221,61 +288,29 @@ def pickup_reserve_message_block(user_slack_id: str, pickup_date: str, pickup_ti
 
 def password_reset_message_block(password: str):
     return [
-		{
-			"type": "header",
-			"text": {
-				"type": "plain_text",
-				"text": "🔐 Okta 비밀번호 초기화 완료",
-				"emoji": True
-			}
-		},
-		{
-			"type": "section",
-			"text": {
-				"type": "mrkdwn",
-				"text": "장비 세팅을 위해 *Okta 비밀번호가 자동으로 초기화* 되었어요 \n아래 버튼을 눌러 초기화된 비밀번호를 확인해주세요"
-			}
-		},
-		{
-			"type": "context",
-			"elements": [
-				{
-					"type": "mrkdwn",
-					"text": "⚠️ 장비 수령 전까지는 *비밀번호를 변경하지 말아주세요*"
-				}
-			]
-		},
-		{
-			"type": "actions",
-			"elements": [
-				{
-					"type": "button",
-					"style": "primary",
-					"text": {
-						"type": "plain_text",
-						"text": "🔑 비밀번호 확인",
-						"emoji": True
-					},
+        _PASSWORD_RESET_HEADER,
+        _PASSWORD_RESET_SECTION,
+        _NO_PASSWORD_CHANGE_CONTEXT,
+        {
+            "type": "actions",
+            "elements": [
+                {
+                    "type": "button",
+                    "style": "primary",
+                    "text": _PASSWORD_BUTTON_TEXT,
                     "value": password,
-					"action_id": "open_password_modal"
-				}
-			]
-		}
-	]
+                    "action_id": "open_password_modal"
+                }
+            ]
+        }
+    ]
 
 def password_check_modal_view(password: str):
     return {
         "type": "modal",
         "callback_id": "password_confirm_view",
-        "title": {
-            "type": "plain_text",
-            "text": "비밀번호 확인",
-            "emoji": True
-        },
-        "close": {
-            "type": "plain_text",
-            "text": "닫기"
-        },
+        "title": _PASSWORD_CHECK_TITLE,
+        "close": _PASSWORD_CHECK_CLOSE,
         "blocks": [
             {
                 "type": "section",
@@ -285,4 +320,4 @@ def password_check_modal_view(password: str):
                 }
             }
         ]
-    }
\ No newline at end of file
+    }
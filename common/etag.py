@@ -0,0 +1,24 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(version: int, *parts: str) -> str:
+    """
+    컬렉션 버전 + 요청 구분값(id, 쿼리 문자열 등)으로 strong ETag 생성
+    :return: '"<version>-<hash>"'
+    """
+    digest = hashlib.sha1("\x1f".join(parts).encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더에 etag가 포함되어 있는지 (GET 조건부 요청은 weak 비교)
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return etag in {tag[2:] if tag.startswith("W/") else tag for tag in candidates}
@@ -1,2 +1,6 @@
 class NotFoundError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class BadRequestError(Exception):
+    pass
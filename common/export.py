@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+from fastapi.responses import StreamingResponse
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 청크 하나에 모아 보낼 최대 크기 (너무 잘게 쪼개면 전송 오버헤드가 커짐)
+_FLUSH_SIZE = 64 * 1024
+
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    dict 스트림 -> NDJSON 청크 스트림
+    - 첫 행은 바로 보내 응답이 곧바로 시작되도록 하고, 이후에는 _FLUSH_SIZE만큼 모아서 전송
+    """
+    buffer = []
+    size = 0
+    for index, row in enumerate(rows):
+        line = json.dumps(row, ensure_ascii=False) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if index == 0 or size >= _FLUSH_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def _csv_value(value: Any) -> Any:
+    # list / dict (quick_actions, checklist 등)는 JSON 문자열로 한 칸에 기록
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def csv_chunks(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    """
+    dict 스트림 -> CSV 청크 스트림 (헤더 먼저 전송)
+    - 첫 행은 바로 보내고, 이후에는 _FLUSH_SIZE만큼 모아서 전송
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    for index, row in enumerate(rows):
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        if index == 0 or buffer.tell() >= _FLUSH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_response(rows: Iterable[Dict[str, Any]], fmt: str, columns: List[str], filename: str) -> StreamingResponse:
+    """
+    커서에서 읽은 문서를 메모리에 모으지 않고 바로 스트리밍
+    :param rows: JSON-safe dict iterator
+    :param fmt: 'ndjson' / 'csv'
+    :param columns: CSV 컬럼 순서
+    :param filename: 확장자를 제외한 다운로드 파일 이름
+    """
+    if fmt == "csv":
+        body = csv_chunks(rows, columns)
+    else:
+        body = ndjson_chunks(rows)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
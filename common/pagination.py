@@ -0,0 +1,57 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from common.exceptions import BadRequestError
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(doc_id: ObjectId, value: Any = None) -> str:
+    """
+    페이지 마지막 문서의 (정렬 값, _id)를 커서 문자열로 인코딩
+    :param doc_id: 마지막 문서의 _id
+    :param value: 마지막 문서의 정렬 필드 값 (_id 정렬이면 None)
+    :return: URL-safe base64 문자열
+    """
+    if isinstance(value, Enum):
+        value = value.value
+
+    payload = {"id": str(doc_id), "v": value}
+    if isinstance(value, datetime):
+        payload["v"] = value.isoformat()
+        payload["t"] = "datetime"
+
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[ObjectId, Any]:
+    """
+    encode_cursor로 만든 커서를 (_id, 정렬 값)으로 복원
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        doc_id = ObjectId(payload["id"])
+        value = payload.get("v")
+        if payload.get("t") == "datetime" and value is not None:
+            value = datetime.fromisoformat(value)
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise BadRequestError("Invalid cursor") from e
+
+    return doc_id, value
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    쿼리 파라미터 'a,b,c' -> ['a', 'b', 'c']
+    """
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(",") if f.strip()] or None
@@ -14,6 +14,11 @@ class CommonResponse:
         self.error = error
         self.status_code = status_code
 
+        # 호출 지표 (외부 API 클라이언트가 채움)
+        self.endpoint: Optional[str] = None
+        self.elapsed_ms: Optional[float] = None
+        self.retries: int = 0
+
     @classmethod
     def success(cls, data: Any = None, status_code: int = 200):
         return cls(
@@ -29,3 +34,9 @@ class CommonResponse:
             error=error,
             status_code=status_code
         )
+
+    def with_metrics(self, endpoint: str, elapsed_ms: float, retries: int = 0):
+        self.endpoint = endpoint
+        self.elapsed_ms = elapsed_ms
+        self.retries = retries
+        return self
@@ -1,3 +1,6 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional
 from bson import ObjectId
 
 
@@ -15,3 +18,42 @@ def serialize_mongo(data):
         return [serialize_mongo(item) for item in data]
 
     return data
+
+
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def to_json_safe(value):
+    """
+    ObjectId -> str, datetime -> ISO 8601 문자열, Enum -> value (중첩 dict / list 포함)
+    """
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    if isinstance(value, dict):
+        return {k: to_json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_json_safe(v) for v in value]
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def serialize_bson(doc: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    as_pymongo() 결과(raw BSON dict)를 한 번의 순회로 JSON-safe dict로 변환
+    - ObjectId -> str, datetime -> ISO 8601 문자열
+    - 최상위 _id -> id
+    :param doc: PyMongo 문서
+    :param fields: 남길 필드 목록 (없으면 전체)
+    """
+    data = {
+        k: to_json_safe(v)
+        for k, v in doc.items()
+        if k != "_id" and (fields is None or k in fields)
+    }
+    data["id"] = str(doc["_id"])
+    return data
@@ -0,0 +1,26 @@
+from typing import Optional, Literal
+from fastapi import APIRouter, HTTPException, Query
+from common.exceptions import BadRequestError
+from common.export import export_response
+from common.pagination import parse_fields
+from services.computer import ComputerService
+
+
+router = APIRouter(prefix="/computer", tags=["Computers"])
+
+
+@router.get("/export", summary="Export computers (NDJSON / CSV streaming)")
+def export_computers(
+        fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+        status: Optional[str] = Query(None, description="장비 상태 (KEEP / SETTING / USE / LOST)"),
+        fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분)"),
+):
+    field_list = parse_fields(fields)
+    try:
+        columns = ComputerService.export_columns(field_list)
+    except BadRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filters = {"status": status} if status else None
+    rows = ComputerService.export(filters=filters, fields=field_list)
+    return export_response(rows, fmt=fmt, columns=columns, filename="computers")
@@ -1,5 +1,9 @@
-from fastapi import APIRouter, HTTPException
-from services.employee import EmployeeService
+from typing import Optional, Literal
+from fastapi import APIRouter, HTTPException, Query
+from common.exceptions import BadRequestError
+from common.export import export_response
+from common.pagination import parse_fields, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from services.employee import EmployeeService, employee_cache
 from schemas.employee import EmployeeCreateSchema, EmployeeUpdateSchema
 
 
@@ -15,9 +19,29 @@ def create_employee(payload: EmployeeCreateSchema):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/export", summary="Export employees (NDJSON / CSV streaming)")
+def export_employees(
+        fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+        fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분)"),
+):
+    field_list = parse_fields(fields)
+    try:
+        columns = EmployeeService.export_columns(field_list)
+    except BadRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = EmployeeService.export(fields=field_list)
+    return export_response(rows, fmt=fmt, columns=columns, filename="employees")
+
+
+@router.get("/cache-stats", summary="Employee 캐시 hit / miss 통계")
+def employee_cache_stats():
+    return employee_cache.get_stats()
+
+
 @router.get("/{employee_id}", summary="Get employee by id")
 def get_employee(employee_id: str):
-    employee = EmployeeService.get(employee_id)
+    employee = EmployeeService.get(employee_id, raw=True)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
 
@@ -25,8 +49,25 @@ def get_employee(employee_id: str):
 
 
 @router.get("/", summary="List employees")
-def list_employees():
-    return EmployeeService.list()
+def list_employees(
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체 조회)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+        fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예. name,email)"),
+):
+    field_list = parse_fields(fields)
+    try:
+        if limit is None and cursor is None:
+            return EmployeeService.list(fields=field_list, raw=True)
+
+        return EmployeeService.paginate(
+            order_by="-id",
+            limit=limit or DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            fields=field_list,
+            raw=True
+        )
+    except BadRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/{employee_id}", summary="Update employees")
@@ -1,9 +1,28 @@
+import asyncio
+import json
 from pydantic import BaseModel
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException
-from common.exceptions import NotFoundError
-from schemas.setting import SettingCreateSchema
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Literal
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from common.etag import make_etag, etag_matches
+from common.exceptions import NotFoundError, BadRequestError
+from common.export import export_response
+from common.pagination import parse_fields, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from schemas.setting import (
+    SettingCreateSchema,
+    SettingListQuery,
+    SettingStatusValue,
+    CompanyValue,
+    OnboardingTypeValue,
+    SettingOrderBy,
+)
+from services.job import JobService
+from services.container import get_setting_service
 from services.setting import SettingService
+from services.setting_events import EventType, setting_events
+from services.setting_summary import SettingSummaryService
+from services.setting_view import setting_view
 
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
@@ -18,6 +37,35 @@ class BulkUpdateRequest(BaseModel):
     updates: List[Dict[str, Any]]
 
 
+BACKGROUND_QUERY = Query(False, description="True면 작업으로 등록 후 job_id를 바로 반환 (GET /settings/jobs/{job_id}로 진행 상태 조회)")
+
+
+def setting_list_query(
+        status: Optional[List[SettingStatusValue]] = Query(None),
+        company: Optional[List[CompanyValue]] = Query(None),
+        onboarding_type: Optional[List[OnboardingTypeValue]] = Query(None),
+        urgency: Optional[bool] = Query(None),
+        assignee_name: Optional[str] = Query(None),
+        requested_date_from: Optional[datetime] = Query(None),
+        requested_date_to: Optional[datetime] = Query(None),
+        due_date_from: Optional[datetime] = Query(None),
+        due_date_to: Optional[datetime] = Query(None),
+        order_by: SettingOrderBy = Query("-created_at"),
+) -> SettingListQuery:
+    return SettingListQuery(
+        status=status,
+        company=company,
+        onboarding_type=onboarding_type,
+        urgency=urgency,
+        assignee_name=assignee_name,
+        requested_date_from=requested_date_from,
+        requested_date_to=requested_date_to,
+        due_date_from=due_date_from,
+        due_date_to=due_date_to,
+        order_by=order_by,
+    )
+
+
 @router.post("/", summary="Create setting")
 def create_setting(payload: SettingCreateSchema):
     try:
@@ -28,9 +76,122 @@ def create_setting(payload: SettingCreateSchema):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/export", summary="Export settings (NDJSON / CSV streaming)")
+def export_settings(
+        query: SettingListQuery = Depends(setting_list_query),
+        fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+        fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분)"),
+):
+    field_list = parse_fields(fields)
+    try:
+        columns = SettingService.export_columns(field_list)
+    except BadRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = SettingService.export(filters=query.to_filters(), order_by=query.order_by, fields=field_list)
+    return export_response(rows, fmt=fmt, columns=columns, filename="settings")
+
+
+def not_modified(request: Request, response: Response, *parts: str, hot_view: bool = False) -> Optional[Response]:
+    """
+    Setting 컬렉션 버전으로 ETag를 계산해 응답 헤더에 설정
+    - If-None-Match가 일치하면 304 응답 반환 (데이터 조회 없음)
+    - 버전은 데이터보다 먼저 읽어야 함 (사이에 변경이 있으면 다음 요청에서 다시 조회됨)
+    :param hot_view: 응답을 setting_view에서 만들 때 True - view에 반영된 상태로 ETag 계산
+    """
+    if hot_view:
+        version, epoch = setting_view.etag_state()
+        etag = make_etag(version, "view", epoch, *parts)
+    else:
+        etag = make_etag(SettingService.version(), *parts)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/stream", summary="Setting 변경 이벤트 스트림 (Server-Sent Events)")
+async def stream_settings(request: Request, last_event_id: Optional[str] = Header(None)):
+    """
+    이벤트: setting.created / setting.updated / setting.deleted / quick_action.updated / settings.resync
+    - SSE id는 "<epoch>-<seq>", 재연결 시 Last-Event-ID 이후 이벤트부터 다시 전달
+      (다른 프로세스 / 재시작 전 id면 settings.resync)
+    - settings.resync를 받으면 목록을 다시 조회
+    """
+    subscription = setting_events.subscribe(last_event_id or None)
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                if subscription.overflowed and subscription.queue.empty():
+                    # 대기열이 넘쳐 이벤트를 놓침 - 재조회 요청 후 연결 종료
+                    yield f"event: {EventType.RESYNC}\ndata: {{}}\n\n"
+                    break
+
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield f"id: {event['event_id']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        finally:
+            setting_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/stats", summary="대시보드 집계 (status / company / onboarding_type / urgency / overdue)")
+def setting_stats(
+        request: Request,
+        response: Response,
+        query: SettingListQuery = Depends(setting_list_query),
+):
+    # overdue는 시간이 지나면 바뀌므로 ETag에 분 단위 시각 포함
+    now = datetime.utcnow()
+    cached = not_modified(request, response, "stats", request.url.query, now.strftime("%Y%m%d%H%M"))
+    if cached:
+        return cached
+
+    return SettingService.stats(filters=query.to_filters(), now=now)
+
+
+@router.get("/summary", summary="Setting 건수 요약 (쓰기 시 갱신되는 요약 문서 조회)")
+def setting_summary():
+    summary = SettingSummaryService.get()
+    if summary is None:
+        # 요약 문서가 아직 없으면 한 번 전체 계산
+        summary = SettingSummaryService.rebuild()
+    return summary
+
+
+@router.post("/summary/rebuild", summary="Setting 건수 요약 전체 재계산")
+def rebuild_setting_summary():
+    return SettingSummaryService.rebuild()
+
+
 @router.get("/{setting_id}", summary="Get setting by id")
-def get_setting(setting_id: str):
-    setting = SettingService.get(setting_id)
+def get_setting(setting_id: str, request: Request, response: Response):
+    use_view = setting_view.serving()
+    cached = not_modified(request, response, setting_id, hot_view=use_view)
+    if cached:
+        return cached
+
+    if use_view:
+        setting = setting_view.get(setting_id)
+    else:
+        setting = SettingService.get(setting_id, raw=True)
     if not setting:
         raise HTTPException(status_code=404, detail="Setting not found")
 
@@ -38,8 +199,43 @@ def get_setting(setting_id: str):
 
 
 @router.get("/", summary="List settings")
-def list_settings():
-    return SettingService.list(order_by="-created_at")
+def list_settings(
+        request: Request,
+        response: Response,
+        query: SettingListQuery = Depends(setting_list_query),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체 조회)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+        fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예. user_name,status)"),
+):
+    # hot view 사용 중이면 메모리에서 필터 / 정렬 (페이지네이션 요청은 MongoDB)
+    use_view = limit is None and cursor is None and setting_view.serving()
+    cached = not_modified(request, response, request.url.query, hot_view=use_view)
+    if cached:
+        return cached
+
+    field_list = parse_fields(fields)
+    try:
+        if limit is None and cursor is None:
+            if use_view:
+                return setting_view.list(query, fields=SettingService._validate_fields(field_list) if field_list else None)
+
+            return SettingService.list(
+                filters=query.to_filters(),
+                order_by=query.order_by,
+                fields=field_list,
+                raw=True
+            )
+
+        return SettingService.paginate(
+            filters=query.to_filters(),
+            order_by=query.order_by,
+            limit=limit or DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            fields=field_list,
+            raw=True
+        )
+    except BadRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/", summary="Bulk update settings")
@@ -55,31 +251,57 @@ def delete_setting(setting_id: str):
     return {"message": "deleted"}
 
 
+@router.get("/jobs/{job_id}", summary="빠른 실행 작업 진행 상태 조회")
+def get_job(job_id: str):
+    job = JobService.get_status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @router.patch("/action/win-setting", summary="빠른 실행 - Okta win setting 그룹에 추가")
-def win_setting(request: OktaRequest):
-    return SettingService().win_setting(request.setting_ids, request.requested_by)
+def win_setting(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("win-setting", request.setting_ids, request.requested_by)}
+    return service.win_setting(request.setting_ids, request.requested_by)
 
 
 @router.patch("/action/okta-setting", summary="빠른 실행 - 비밀번호 초기화 및 Okta setting 그룹에 추가")
-def okta_setting(request: OktaRequest):
-    return SettingService().okta_setting(request.setting_ids, request.requested_by)
+def okta_setting(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("okta-setting", request.setting_ids, request.requested_by)}
+    return service.okta_setting(request.setting_ids, request.requested_by)
 
 
 @router.patch("/action/o365-intune", summary="빠른 실행 - Okta o365 intune 그룹에 추가")
-def o365_setting(request: OktaRequest):
-    return SettingService().o365_setting(request.setting_ids, request.requested_by)
+def o365_setting(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("o365-intune", request.setting_ids, request.requested_by)}
+    return service.o365_setting(request.setting_ids, request.requested_by)
 
 
 @router.patch("/action/password-notice", summary="빠른 실행 - 비밀번호 초기화 안내 전송")
-def password_notice(request: OktaRequest):
-    return SettingService().password_notice(request.setting_ids, request.requested_by)
+def password_notice(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("password-notice", request.setting_ids, request.requested_by)}
+    return service.password_notice(request.setting_ids, request.requested_by)
 
 
 @router.patch("/action/pickup-notice", summary="빠른 실행 - 장비 수령 안내 전송")
-def pickup_notice(request: OktaRequest):
-    return SettingService().pickup_notice(request.setting_ids, request.requested_by)
+def pickup_notice(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("pickup-notice", request.setting_ids, request.requested_by)}
+    return service.pickup_notice(request.setting_ids, request.requested_by)
 
 
 @router.patch("/action/okta-activate", summary="빠른 실행 - Okta 계정 활성화")
-def okta_activate(request: OktaRequest):
-    return SettingService().okta_activate(request.setting_ids, request.requested_by)
+def okta_activate(request: OktaRequest, background: bool = BACKGROUND_QUERY,
+        service: SettingService = Depends(get_setting_service)):
+    if background:
+        return {"job_id": JobService.enqueue("okta-activate", request.setting_ids, request.requested_by)}
+    return service.okta_activate(request.setting_ids, request.requested_by)
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Request
-from slack_bolt.adapter.fastapi import SlackRequestHandler
-from modules.slack import BoltApp
+from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
+from modules.slack import AsyncBoltApp
 from common.slack import SlackBotName
 from services.slack import open_pickup_modal, handle_pickup_submission, open_password_modal
 
 router = APIRouter(prefix="/slack", tags=["Slack"])
 
-slack_app = BoltApp(SlackBotName.SETTING_BOT)
-handler = SlackRequestHandler(slack_app)
+# 리스너가 이벤트 루프 안에서 await로 Slack API를 호출하도록 AsyncApp 사용
+slack_app = AsyncBoltApp(SlackBotName.SETTING_BOT)
+handler = AsyncSlackRequestHandler(slack_app)
 
 slack_app.action("open_pickup_modal")(open_pickup_modal)
 slack_app.view("pickup_info_submit")(handle_pickup_submission)
@@ -16,3 +17,8 @@ slack_app.action("open_password_modal")(open_password_modal)
 @router.post("/events")
 async def slack_events(req: Request):
     return await handler.handle(req)
+
+
+@router.get("/rate-limit", summary="Slack API 메서드별 호출 / 대기 시간 / 429 통계")
+def slack_rate_limit_stats():
+    return slack_app.client.get_stats()
@@ -1,16 +1,73 @@
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
 from dotenv import load_dotenv
 from mongoengine import connect
+from pymongo import monitoring
 
 
 load_dotenv()
 
 
+class QueryCount:
+    """
+    요청 하나의 명령 수 - 빠른 실행 워커 등 여러 스레드에서 함께 증가시킬 수 있음
+    """
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def increment(self):
+        with self._lock:
+            self.value += 1
+
+
+_query_count: ContextVar[Optional[QueryCount]] = ContextVar("mongo_query_count", default=None)
+
+
+class QueryCountListener(monitoring.CommandListener):
+    """
+    현재 컨텍스트(요청)에서 실행된 MongoDB 명령 수 집계
+    """
+
+    def started(self, event):
+        counter = _query_count.get()
+        if counter is not None:
+            counter.increment()
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCount]:
+    """
+    with 블록 안에서 실행된 MongoDB 명령(round trip) 수를 셈
+
+    with count_queries() as counter:
+        ...
+    counter.value
+    """
+    counter = QueryCount()
+    token = _query_count.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_count.reset(token)
+
+
 def connect_to_mongo():
     connect(
         db=os.getenv("MONGODB_DB_NAME"),
         host=os.getenv("MONGODB_URL"),
-        alias="default"
+        alias="default",
+        event_listeners=[QueryCountListener()]
     )
     print("✔️ MongoDB connected")
 
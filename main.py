@@ -1,20 +1,84 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from db.mongodb import connect_to_mongo
+from fastapi.responses import JSONResponse
+from db.mongodb import connect_to_mongo, count_queries
+from services.container import init_container, close_container
+from services.job import JobService
+from services.setting_events import start_event_source, stop_event_source
+from services.setting_view import start_hot_view, setting_view
 from controllers.slack import router as SlackRouter
 from controllers.setting import router as SettingController
 from controllers.employee import router as EmployeeController
+from controllers.computer import router as ComputerController
+from airflow.sync_setting_computers import sync_setting_computers
+
+# 서버 시작 시 장비 동기화를 백그라운드로 실행할지 여부 (주기 실행은 Airflow가 담당)
+SYNC_ON_STARTUP = os.getenv("SYNC_ON_STARTUP", "true").lower() == "true"
+
+
+async def run_startup_sync(app: FastAPI):
+    """
+    시작 시 장비 동기화 - 요청 처리를 막지 않도록 별도 스레드에서 실행하고 결과는 /ready로 노출
+    """
+    app.state.sync = {"status": "running", "started_at": datetime.utcnow()}
+    try:
+        result = await asyncio.to_thread(sync_setting_computers)
+        app.state.sync = {
+            "status": "done",
+            "started_at": app.state.sync["started_at"],
+            "finished_at": datetime.utcnow(),
+            "result": result,
+        }
+    except Exception as e:
+        app.state.sync = {
+            "status": "error",
+            "started_at": app.state.sync["started_at"],
+            "finished_at": datetime.utcnow(),
+            "error": str(e),
+        }
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    connect_to_mongo()
+    # Okta / Slack 클라이언트와 서비스는 프로세스당 한 번만 생성
+    init_container()
+
+    # Setting in-memory hot view (SETTING_HOT_VIEW) - change stream 스레드가 구독 직후 전체 로드
+    hot_view = start_hot_view()
+
+    # Setting 변경 이벤트 (GET /settings/stream) - change stream을 쓸 수 없으면 local 발행
+    app.state.event_source = start_event_source(force=hot_view)
+
+    # 이전 프로세스에서 실행되지 못한 일괄 작업 이어서 실행
+    JobService.resume_queued()
 
-app = FastAPI(title="PC Setting Dashboard API")
+    app.state.sync = {"status": "skipped"}
+    sync_task = asyncio.create_task(run_startup_sync(app)) if SYNC_ON_STARTUP else None
+
+    app.state.ready = True
+    yield
+    app.state.ready = False
+
+    if sync_task and not sync_task.done():
+        sync_task.cancel()
+
+    stop_event_source()
+    close_container()
+
+
+app = FastAPI(title="PC Setting Dashboard API", lifespan=lifespan)
+app.state.ready = False
 
 origins = [
     "http://localhost:5173",
 ]
 
-from airflow.sync_setting_computers import sync_setting_computers
-connect_to_mongo()
-sync_setting_computers()
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -23,15 +87,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-def startup():
-    connect_to_mongo()
+@app.middleware("http")
+async def mongo_query_count(request: Request, call_next):
+    """
+    요청마다 실행된 MongoDB 명령 수를 응답 헤더로 전달
+    """
+    with count_queries() as counter:
+        response = await call_next(request)
+    response.headers["X-Mongo-Query-Count"] = str(counter.value)
+    return response
 
 
 @app.get("/")
 def root():
     return {"message": "Hello World"}
 
+
+@app.get("/ready", summary="Readiness check")
+def ready():
+    """
+    MongoDB 연결 완료 여부 + 시작 시 장비 동기화 상태
+    """
+    return JSONResponse(
+        status_code=200 if app.state.ready else 503,
+        content=jsonable_encoder({
+            "ready": app.state.ready,
+            "sync": getattr(app.state, "sync", None),
+            "hot_view": setting_view.stats(),
+        })
+    )
+
 app.include_router(SlackRouter)
 app.include_router(SettingController)
-app.include_router(EmployeeController)
\ No newline at end of file
+app.include_router(EmployeeController)
+app.include_router(ComputerController)
@@ -0,0 +1,19 @@
+from mongoengine import (
+    Document,
+    StringField,
+    IntField,
+    DateTimeField,
+)
+
+
+class CollectionVersion(Document):
+    """
+    컬렉션 변경 버전 (쓰기가 일어날 때마다 1씩 증가)
+    - ETag 계산용
+    """
+    name = StringField(primary_key=True)    # 컬렉션 이름 (예. setting)
+
+    version = IntField(default=0)
+    updated_at = DateTimeField(null=True)
+
+    meta = {"collection": "collection_versions"}
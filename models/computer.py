@@ -47,11 +47,15 @@ class Computer(Document):
     status = EnumField(ComputerStatus, required=True, default=ComputerStatus.KEEP)
     notes = StringField(null=True)
 
+    # 증분 동기화(sync_setting_computers) 워터마크 기준
+    # - status 등을 바꾸는 쪽(외부 자산 시스템 포함)은 반드시 함께 갱신할 것
     updated_at = DateTimeField(default=datetime.utcnow)
 
     meta = {
         "collection": "computers",
         "indexes": [
             "device_id",
+            "status",
+            "updated_at",
         ]
     }
@@ -0,0 +1,61 @@
+from enum import Enum
+from mongoengine import (
+    Document,
+    EmbeddedDocument,
+    StringField,
+    DateTimeField,
+    DictField,
+    IntField,
+    ListField,
+    EmbeddedDocumentListField,
+)
+from mongoengine.fields import EnumField
+from datetime import datetime
+from models.setting import QuickActionStatus
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"   # 대기
+    RUNNING = "running" # 실행 중
+    DONE = "done"   # 완료 (개별 실패 포함)
+    ERROR = "error" # 작업 자체 실패
+
+
+class JobItem(EmbeddedDocument):
+    """
+    Setting별 진행 상태
+    """
+    setting_id = StringField(required=True)
+    status = EnumField(QuickActionStatus, required=True, default=QuickActionStatus.PENDING)
+    error_message = StringField(required=False, null=True)
+
+
+class QuickActionJob(Document):
+    """
+    일괄 빠른 실행 비동기 작업
+    """
+    action = StringField(required=True) # 액션 이름 (win-setting, okta-setting 등)
+    setting_ids = ListField(StringField())
+    requested_by = StringField(null=True)
+
+    status = EnumField(JobStatus, required=True, default=JobStatus.QUEUED)
+    items = EmbeddedDocumentListField(JobItem)
+    result = DictField(null=True)   # 빠른 실행 응답 (failed_users, success_count 등)
+    error_message = StringField(null=True)
+
+    created_at = DateTimeField(default=datetime.utcnow)
+    started_at = DateTimeField(null=True)
+    finished_at = DateTimeField(null=True)
+
+    # 실행 중인 프로세스의 lease (하트비트로 연장, 만료되면 resume_queued가 회수)
+    locked_by = StringField(null=True)
+    locked_until = DateTimeField(null=True)
+    attempts = IntField(default=0)  # 실행 시작 횟수
+
+    meta = {
+        "collection": "quick_action_jobs",
+        "indexes": [
+            ("status", "created_at"),
+            ("status", "locked_until"),
+        ]
+    }
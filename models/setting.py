@@ -70,6 +70,11 @@ class CheckListItem(EmbeddedDocument):
     checked = BooleanField(default=False)   # 완료 여부
 
 
+# GET /settings 등치 필터 필드 / 정렬 키 (인덱스 생성용)
+LIST_FILTER_FIELDS = ("status", "company", "onboarding_type", "urgency", "assignee_name")
+LIST_SORT_INDEXES = (("-created_at", "-id"), ("due_date", "id"), ("requested_date", "id"))
+
+
 class Setting(Document):
     """
     PC 세팅 요청 메인 모델
@@ -110,10 +115,18 @@ class Setting(Document):
     created_at = DateTimeField(default=datetime.utcnow)
 
 
+    # 목록 필터 / 정렬용 복합 인덱스
+    # - 순서: 등치 조건 -> 정렬 필드 -> _id(keyset 페이지네이션 tie-breaker)
+    # - 등치 필터 하나 x 정렬(created_at / due_date / requested_date)마다 인덱스를 둠
+    #   (여러 필터를 함께 쓰면 그중 하나의 인덱스로 정렬 순서대로 읽고 나머지 조건은 문서에서 확인)
+    # - 일정 범위 필터(requested_date, due_date)는 같은 필드로 정렬할 때 인덱스 범위 스캔으로 처리
+    #   (다른 필드로 정렬하면 범위 스캔 후 메모리 정렬)
     meta = {
         "collection": "setting",
         "indexes": [
             "user_email",
             "serial",
+            *LIST_SORT_INDEXES,
+            *[(field, *sort) for field in LIST_FILTER_FIELDS for sort in LIST_SORT_INDEXES],
         ]
     }
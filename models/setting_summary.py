@@ -0,0 +1,27 @@
+from mongoengine import (
+    Document,
+    StringField,
+    IntField,
+    DictField,
+    DateTimeField,
+)
+
+
+class SettingSummary(Document):
+    """
+    Setting 건수 요약 (쓰기 경로에서 $inc로 갱신)
+    - status / company / onboarding_type: {값: 건수}
+    - quick_actions: {액션 이름: {상태: 건수}}
+    """
+    name = StringField(primary_key=True)
+
+    total = IntField(default=0)
+    status = DictField()
+    company = DictField()
+    onboarding_type = DictField()
+    quick_actions = DictField()
+
+    updated_at = DateTimeField(null=True)
+    rebuilt_at = DateTimeField(null=True)   # 마지막 전체 재계산 시각
+
+    meta = {"collection": "setting_summary"}
@@ -0,0 +1,24 @@
+from mongoengine import (
+    Document,
+    StringField,
+    DateTimeField,
+    DictField,
+)
+
+
+class SyncState(Document):
+    """
+    배치 동기화 진행 상태 (워터마크)
+    """
+    name = StringField(primary_key=True)    # 동기화 이름 (예. setting_computers)
+
+    watermark = DateTimeField(null=True)    # 마지막으로 반영한 Computer.updated_at
+    last_full_sync_at = DateTimeField(null=True)    # 마지막 전체 동기화 시각
+    last_run_at = DateTimeField(null=True)
+    last_result = DictField(null=True)
+
+    # 여러 프로세스(워커)에서 동시에 실행되지 않도록 잡는 lease 락
+    locked_by = StringField(null=True)
+    locked_until = DateTimeField(null=True)
+
+    meta = {"collection": "sync_state"}
@@ -1,45 +1,221 @@
+import asyncio
 import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
 from dotenv import load_dotenv
 from common.response import CommonResponse
 
 
-class OktaClient():
-    def __init__(self):
-        load_dotenv()
+load_dotenv()
+
+OKTA_CONNECT_TIMEOUT = float(os.getenv("OKTA_CONNECT_TIMEOUT", "3"))
+OKTA_READ_TIMEOUT = float(os.getenv("OKTA_READ_TIMEOUT", "10"))
+OKTA_MAX_RETRIES = int(os.getenv("OKTA_MAX_RETRIES", "3"))
+OKTA_POOL_SIZE = int(os.getenv("OKTA_POOL_SIZE", "20"))
+# AsyncOktaClient 일괄 호출 시 동시에 보내는 요청 수
+OKTA_MAX_CONCURRENCY = int(os.getenv("OKTA_MAX_CONCURRENCY", "10"))
+
+# 재시도 대상 응답 코드 (429: rate limit, 5xx: 일시 장애)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# 다시 보내도 결과가 같은 메서드 - 그 외(POST: activate, 비밀번호 초기화 등)는 요청이 전달되지 않았거나 429일 때만 재시도
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_WAIT = 60.0
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """
+    rate limit 헤더 값 - 형식이 잘못되었으면 None (헤더 때문에 호출이 실패하지 않도록)
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _connection_not_established(error: BaseException) -> bool:
+    """
+    requests.ConnectionError가 연결을 맺기 전 실패(connection refused / connect timeout / DNS)인지
+    - requests -> urllib3 MaxRetryError.reason -> NewConnectionError 순으로 감싸져 있어 원인을 따라가며 확인
+    """
+    seen = set()
+    stack = [error]
+    while stack:
+        current = stack.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        if isinstance(current, (requests.ConnectTimeout, ConnectTimeoutError, ConnectionRefusedError)):
+            return True
+
+        stack.extend([current.__cause__, current.__context__, getattr(current, "reason", None)])
+        stack.extend(arg for arg in getattr(current, "args", ()) if isinstance(arg, BaseException))
+    return False
+
+
+class OktaClientBase:
+    """
+    동기 / 비동기 Okta 클라이언트 공통 - 설정, 호출 지표, rate limit 상태
+    """
+
+    def __init__(self, base_url: Optional[str] = None):
         self.okta_domain = os.getenv("OKTA_DOMAIN")
-        self.base_url = f"https://{self.okta_domain}/api/v1"
+        # base_url: 테스트용 로컬 fake 서버 주소 등으로 교체 가능
+        self.base_url = base_url or f"https://{self.okta_domain}/api/v1"
         self.headers = {
             "Authorization": f"Bearer {os.getenv('OKTA_AUTH_TOKEN')}",
         }
 
-    def okta_call_api(self, endpoint: str = None, payload: dict = None, method: str = 'GET') -> CommonResponse:
+        # endpoint별 호출 지표 / rate limit 상태
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._rate_limit_reset: Dict[str, float] = {}
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        endpoint별 호출 수 / 실패 수 / 재시도 수 / 평균·최대 지연(ms)
+        """
+        with self._lock:
+            return {
+                key: {
+                    **stat,
+                    "avg_ms": round(stat["total_ms"] / stat["calls"], 1) if stat["calls"] else 0.0,
+                }
+                for key, stat in self._stats.items()
+            }
+
+    def _finish(self, key: str, started: float, retries: int, res: CommonResponse) -> CommonResponse:
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        with self._lock:
+            stat = self._stats.setdefault(key, {"calls": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stat["calls"] += 1
+            stat["errors"] += 0 if res.ok else 1
+            stat["retries"] += retries
+            stat["total_ms"] += elapsed_ms
+            stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+        return res.with_metrics(endpoint=key, elapsed_ms=elapsed_ms, retries=retries)
+
+    def _record_rate_limit(self, key: str, headers):
+        remaining = _parse_number(headers.get("X-Rate-Limit-Remaining"))
+        reset = _parse_number(headers.get("X-Rate-Limit-Reset"))
+        if remaining is None or reset is None:
+            return
+
+        with self._lock:
+            if remaining <= 0:
+                self._rate_limit_reset[key] = reset
+            else:
+                self._rate_limit_reset.pop(key, None)
+
+    def _rate_limit_wait(self, key: str) -> float:
+        """
+        직전 응답 기준 남은 호출 수가 0이면 reset 시각까지 기다릴 시간(초)
+        """
+        with self._lock:
+            reset_at = self._rate_limit_reset.get(key)
+        if not reset_at:
+            return 0.0
+        return min(max(reset_at - time.time(), 0.0), MAX_RETRY_WAIT)
+
+    @staticmethod
+    def _retryable_status(method: str, status_code: int) -> bool:
+        """
+        429는 처리되지 않은 요청이므로 항상 재시도, 5xx는 처리 여부를 알 수 없어 멱등 메서드만 재시도
+        """
+        if status_code == 429:
+            return True
+        return status_code in RETRY_STATUS_CODES and method in IDEMPOTENT_METHODS
+
+    def _retry_wait(self, status_code: int, headers, retries: int) -> float:
+        reset = _parse_number(headers.get("X-Rate-Limit-Reset"))
+        if status_code == 429 and reset is not None:
+            # reset은 epoch 초 단위 - 동시에 몰리지 않도록 약간의 jitter 추가
+            return min(max(reset - time.time(), 0) + random.uniform(0, 0.5), MAX_RETRY_WAIT)
+        return self._backoff(retries)
+
+    @staticmethod
+    def _backoff(retries: int) -> float:
+        return min(0.5 * (2 ** retries) + random.uniform(0, 0.25), MAX_RETRY_WAIT)
+
+
+class OktaClient(OktaClientBase):
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(base_url)
+        self.timeout = (OKTA_CONNECT_TIMEOUT, OKTA_READ_TIMEOUT)
+
+        # 커넥션 재사용 (매 호출마다 TLS 연결을 새로 맺지 않음)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=OKTA_POOL_SIZE))
+
+    def okta_call_api(self, endpoint: str = None, payload: dict = None, method: str = 'GET', metric_key: str = None) -> CommonResponse:
+        """
+        Okta API 호출
+        - 429 응답과 연결을 맺지 못한 실패는 backoff 후 재시도 (429는 X-Rate-Limit-Reset 시각까지 대기)
+        - 5xx 응답과 요청 전송 후 끊긴 연결은 멱등 메서드(GET / PUT / DELETE 등)만 재시도
+        - 직전 응답에서 X-Rate-Limit-Remaining이 0이면 reset 시각까지 기다린 뒤 호출
+        :param metric_key: 지표 집계 키 (예. 'PUT /groups/{groupId}/users/{userId}'), 없으면 method + endpoint
+        """
         if method:
             method = method.upper()
 
-        try:
-            response = requests.request(
-                method=method,
-                url=f"{self.base_url}{endpoint}",
-                json=payload,
-                headers=self.headers,
-            )
-        except requests.RequestException as e:
-            return CommonResponse.failure(error=str(e), status_code=500)
+        key = metric_key or f"{method} {endpoint}"
+        started = time.perf_counter()
+        retries = 0
+
+        time.sleep(self._rate_limit_wait(key))
+
+        while True:
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=f"{self.base_url}{endpoint}",
+                    json=payload,
+                    timeout=self.timeout,
+                )
+            except requests.ConnectionError as e:
+                # ConnectionError에는 요청 전송 후 끊긴 경우(Connection aborted 등)도 포함되므로
+                # 멱등 메서드가 아니면 연결 자체를 맺지 못한 경우만 재시도 (read timeout은 재시도하지 않음)
+                if retries < OKTA_MAX_RETRIES and (method in IDEMPOTENT_METHODS or _connection_not_established(e)):
+                    time.sleep(self._backoff(retries))
+                    retries += 1
+                    continue
+                return self._finish(key, started, retries, CommonResponse.failure(error=str(e), status_code=500))
+            except requests.RequestException as e:
+                return self._finish(key, started, retries, CommonResponse.failure(error=str(e), status_code=500))
+
+            self._record_rate_limit(key, response.headers)
+
+            if retries < OKTA_MAX_RETRIES and self._retryable_status(method, response.status_code):
+                time.sleep(self._retry_wait(response.status_code, response.headers, retries))
+                retries += 1
+                continue
+            break
 
         if not response.ok:
-            return CommonResponse.failure(
+            return self._finish(key, started, retries, CommonResponse.failure(
                 error=response.text,
                 status_code=response.status_code
-            )
+            ))
 
         if response.status_code == 204:
-            return CommonResponse.success(data=None, status_code=204)
+            return self._finish(key, started, retries, CommonResponse.success(data=None, status_code=204))
 
-        return CommonResponse.success(
+        return self._finish(key, started, retries, CommonResponse.success(
             data=response.json(),
             status_code=response.status_code
-        )
+        ))
 
     def add_user_to_group(self, group_id: str, user_id: str):
         """
@@ -48,7 +224,8 @@ class OktaClient():
         :param user_id: Okta user id
         :return: 204 No Content
         """
-        return self.okta_call_api(endpoint=f"/groups/{group_id}/users/{user_id}", method="PUT")
+        return self.okta_call_api(endpoint=f"/groups/{group_id}/users/{user_id}", method="PUT",
+                                  metric_key="PUT /groups/{groupId}/users/{userId}")
 
     def activate_user(self, user_id: str, send_email: bool = False):
         """
@@ -57,7 +234,8 @@ class OktaClient():
         :param send_email: 사용자에게 활성화 이메일 보냄(default: False)
         :return: 200 { activationToken: str, activationUrl: str }
         """
-        return self.okta_call_api(endpoint=f"/users/{user_id}/lifecycle/activate?sendEmail={send_email}", method="POST")
+        return self.okta_call_api(endpoint=f"/users/{user_id}/lifecycle/activate?sendEmail={send_email}", method="POST",
+                                  metric_key="POST /users/{userId}/lifecycle/activate")
 
     def admin_set_password(self, user_id: str, new_password: str):
         """
@@ -67,6 +245,7 @@ class OktaClient():
         :return:
         """
         return self.okta_call_api(endpoint=f"/users/{user_id}", method="POST",
+                                    metric_key="POST /users/{userId}",
                                     payload={
                                         "credentials": {
                                             "password": {
@@ -74,3 +253,157 @@ class OktaClient():
                                             }
                                         }
                                     })
+
+
+class AsyncOktaClient(OktaClientBase):
+    """
+    httpx.AsyncClient 기반 Okta 클라이언트
+    - 그룹 추가 / 계정 활성화처럼 사용자별로 독립적인 호출을 한 이벤트 루프에서 동시에 처리
+    - 재시도 / rate limit 처리는 OktaClient와 동일
+
+    async with AsyncOktaClient() as okta:
+        results = await okta.add_users_to_group(group_id, user_ids)
+    """
+
+    def __init__(self, base_url: Optional[str] = None, max_concurrency: int = OKTA_MAX_CONCURRENCY,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(base_url)
+        self.max_concurrency = max_concurrency
+        # transport: 테스트용 httpx.MockTransport 등으로 교체 가능 (default: 실제 네트워크)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            transport=transport,
+            timeout=httpx.Timeout(OKTA_READ_TIMEOUT, connect=OKTA_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=OKTA_POOL_SIZE, max_keepalive_connections=OKTA_POOL_SIZE),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def okta_call_api(self, endpoint: str = None, payload: dict = None, method: str = 'GET', metric_key: str = None) -> CommonResponse:
+        """
+        Okta API 비동기 호출 (재시도 / rate limit 규칙은 OktaClient.okta_call_api와 동일)
+        """
+        if method:
+            method = method.upper()
+
+        key = metric_key or f"{method} {endpoint}"
+        started = time.perf_counter()
+        retries = 0
+
+        await asyncio.sleep(self._rate_limit_wait(key))
+
+        while True:
+            try:
+                response = await self.client.request(
+                    method=method,
+                    url=f"{self.base_url}{endpoint}",
+                    json=payload,
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                # 연결을 맺기 전 실패라 요청이 전달되지 않음 - 모든 메서드 재시도
+                # (전송 후 끊긴 경우는 ReadError / RemoteProtocolError 등으로 구분되어 재시도하지 않음)
+                if retries < OKTA_MAX_RETRIES:
+                    await asyncio.sleep(self._backoff(retries))
+                    retries += 1
+                    continue
+                return self._finish(key, started, retries, CommonResponse.failure(error=str(e), status_code=500))
+            except httpx.HTTPError as e:
+                return self._finish(key, started, retries, CommonResponse.failure(error=str(e), status_code=500))
+
+            self._record_rate_limit(key, response.headers)
+
+            if retries < OKTA_MAX_RETRIES and self._retryable_status(method, response.status_code):
+                await asyncio.sleep(self._retry_wait(response.status_code, response.headers, retries))
+                retries += 1
+                continue
+            break
+
+        if not response.is_success:
+            return self._finish(key, started, retries, CommonResponse.failure(
+                error=response.text,
+                status_code=response.status_code
+            ))
+
+        if response.status_code == 204:
+            return self._finish(key, started, retries, CommonResponse.success(data=None, status_code=204))
+
+        return self._finish(key, started, retries, CommonResponse.success(
+            data=response.json(),
+            status_code=response.status_code
+        ))
+
+    async def add_user_to_group(self, group_id: str, user_id: str):
+        """
+        그룹에 사용자 추가
+        :param group_id: Okta group id
+        :param user_id: Okta user id
+        :return: 204 No Content
+        """
+        return await self.okta_call_api(endpoint=f"/groups/{group_id}/users/{user_id}", method="PUT",
+                                        metric_key="PUT /groups/{groupId}/users/{userId}")
+
+    async def activate_user(self, user_id: str, send_email: bool = False):
+        """
+        사용자 계정 활성화
+        :param user_id: Okta user id
+        :param send_email: 사용자에게 활성화 이메일 보냄(default: False)
+        :return: 200 { activationToken: str, activationUrl: str }
+        """
+        return await self.okta_call_api(endpoint=f"/users/{user_id}/lifecycle/activate?sendEmail={send_email}", method="POST",
+                                        metric_key="POST /users/{userId}/lifecycle/activate")
+
+    async def admin_set_password(self, user_id: str, new_password: str):
+        """
+        관리자용 사용자 비밀번호 초기화
+        :param user_id: Okta user id
+        :param new_password: 변경할 비밀번호
+        :return:
+        """
+        return await self.okta_call_api(endpoint=f"/users/{user_id}", method="POST",
+                                        metric_key="POST /users/{userId}",
+                                        payload={
+                                            "credentials": {
+                                                "password": {
+                                                    "value": new_password
+                                                }
+                                            }
+                                        })
+
+    async def add_users_to_group(self, group_id: str, user_ids: Iterable[str],
+                                 concurrency: Optional[int] = None) -> Dict[str, CommonResponse]:
+        """
+        여러 사용자를 한 그룹에 동시에 추가
+        :param concurrency: 동시 요청 수 상한 (default: max_concurrency)
+        :return: {user_id: CommonResponse}
+        """
+        return await self._gather(user_ids, lambda user_id: self.add_user_to_group(group_id, user_id), concurrency)
+
+    async def activate_users(self, user_ids: Iterable[str], send_email: bool = False,
+                             concurrency: Optional[int] = None) -> Dict[str, CommonResponse]:
+        """
+        여러 사용자 계정을 동시에 활성화
+        :param concurrency: 동시 요청 수 상한 (default: max_concurrency)
+        :return: {user_id: CommonResponse}
+        """
+        return await self._gather(user_ids, lambda user_id: self.activate_user(user_id, send_email), concurrency)
+
+    async def _gather(self, user_ids: Iterable[str], call, concurrency: Optional[int] = None) -> Dict[str, CommonResponse]:
+        """
+        사용자별 호출을 동시 요청 수 상한 안에서 실행 (중복 id는 한 번만 호출)
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+        user_ids = list(dict.fromkeys(user_ids))
+
+        async def run(user_id: str) -> CommonResponse:
+            async with semaphore:
+                return await call(user_id)
+
+        results = await asyncio.gather(*(run(user_id) for user_id in user_ids))
+        return dict(zip(user_ids, results))
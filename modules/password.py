@@ -1,17 +1,32 @@
 import datetime
 import random
 import string
+from functools import lru_cache
 
 
 PASSWORD_CHANGE_INTERVAL_WEEKS = 2  # 주기(현재는 2주마다)
 
-def generate_custom_password():
-    part1 = ''.join(random.choices(string.ascii_uppercase, k=5))
-    part2 = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
-    part3 = ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
+def generate_custom_password(rng: random.Random = None):
+    """
+    :param rng: 사용할 난수 생성기 (없으면 전역 random)
+    """
+    rng = rng or random
+    part1 = ''.join(rng.choices(string.ascii_uppercase, k=5))
+    part2 = ''.join(rng.choices(string.ascii_uppercase + string.digits, k=5))
+    part3 = ''.join(rng.choices(string.ascii_uppercase + string.digits, k=5))
     return f"{part1}-{part2}-{part3}"
 
 
+@lru_cache(maxsize=8)
+def _password_for_cycle(cycle_index: int) -> str:
+    """
+    주기별 비밀번호 (주기마다 한 번만 생성)
+    - 전역 random을 다시 seed하지 않도록 주기 전용 Random 인스턴스 사용 (여러 스레드에서 호출해도 안전)
+    - random.seed(cycle_index) 후 생성하던 기존 비밀번호와 같은 값
+    """
+    return generate_custom_password(random.Random(cycle_index))
+
+
 def generate_password_for_week(start_date: datetime.date = None) -> str:
     """
     현재 날짜 기준으로 PASSWORD_CHANGE_INTERVAL_WEEKS마다
@@ -30,7 +45,4 @@ def generate_password_for_week(start_date: datetime.date = None) -> str:
     cycle_index = delta_weeks // PASSWORD_CHANGE_INTERVAL_WEEKS
 
     # 시드 고정 → 같은 주기에는 항상 같은 비밀번호
-    random.seed(cycle_index)
-    password = generate_custom_password()
-
-    return password
+    return _password_for_cycle(cycle_index)
@@ -1,11 +1,33 @@
+from typing import Tuple
 from slack_bolt import App
+from slack_bolt.async_app import AsyncApp
 from common.crypto import decrypt
 from common.slack import SlackEnvKey
+from modules.slack_rate_limit import RateLimitedWebClient, AsyncRateLimitedWebClient, SlackRateLimiter
+
+
+# 같은 봇의 동기 / 비동기 App이 Slack rate limit을 함께 계산하도록 봇별로 하나만 사용
+_rate_limiters: dict[str, SlackRateLimiter] = {}
+
+
+def _credentials(app_name: str) -> Tuple[str, str]:
+    token_env = SlackEnvKey.BOT_TOKENS.get(app_name)
+    secret_env = SlackEnvKey.SIGNING_SECRETS.get(app_name)
+
+    if not token_env or not secret_env:
+        raise ValueError(f"Slack env key not defined for app: {app_name}")
+
+    return decrypt(token_env), decrypt(secret_env)
+
+
+def _rate_limiter(app_name: str) -> SlackRateLimiter:
+    return _rate_limiters.setdefault(app_name, SlackRateLimiter())
 
 
 class BoltApp:
     """
     Slack Bolt App 싱글톤 래퍼
+    - 빠른 실행(스레드 풀)에서 쓰는 동기 WebClient 용도
     """
     _apps: dict[str, App] = {}
 
@@ -13,16 +35,46 @@ class BoltApp:
         if app_name in cls._apps:
             return cls._apps[app_name]
 
-        token_env = SlackEnvKey.BOT_TOKENS.get(app_name)
-        secret_env = SlackEnvKey.SIGNING_SECRETS.get(app_name)
-
-        if not token_env or not secret_env:
-            raise ValueError(f"Slack env key not defined for app: {app_name}")
+        token, signing_secret = _credentials(app_name)
 
+        # Slack rate limit을 넘지 않도록 tier별로 호출 속도를 조절하는 client 사용
         app = App(
-            token=decrypt(token_env),
-            signing_secret=decrypt(secret_env),
+            client=RateLimitedWebClient(token=token, rate_limiter=_rate_limiter(app_name)),
+            signing_secret=signing_secret,
+        )
+
+        # Bolt는 요청마다 새 WebClient를 만들어 리스너에 넘기므로 rate limit client로 교체
+        @app.use
+        def use_rate_limited_client(context, next):
+            context["client"] = app.client
+            next()
+
+        cls._apps[app_name] = app
+        return app
+
+
+class AsyncBoltApp:
+    """
+    Slack Bolt AsyncApp 싱글톤 래퍼
+    - /slack/events 인터랙션 처리용 (리스너의 Slack API 호출이 이벤트 루프를 막지 않음)
+    """
+    _apps: dict[str, AsyncApp] = {}
+
+    def __new__(cls, app_name: str) -> AsyncApp:
+        if app_name in cls._apps:
+            return cls._apps[app_name]
+
+        token, signing_secret = _credentials(app_name)
+
+        app = AsyncApp(
+            client=AsyncRateLimitedWebClient(token=token, rate_limiter=_rate_limiter(app_name)),
+            signing_secret=signing_secret,
         )
 
+        @app.use
+        async def use_rate_limited_client(context, next):
+            context["client"] = app.client
+            await next()
+
         cls._apps[app_name] = app
         return app
@@ -0,0 +1,258 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+
+# Slack Web API 메서드 tier별 분당 호출 수 (https://api.slack.com/apis/rate-limits)
+SLACK_TIER_PER_MINUTE = {
+    1: 1,
+    2: 20,
+    3: 50,
+    4: 100,
+}
+
+# 사용하는 메서드의 tier (정의되지 않은 메서드는 tier 3으로 취급)
+SLACK_METHOD_TIERS = {
+    "auth.test": 4,
+    "chat.update": 3,
+    "users.lookupByEmail": 4,
+    "users.info": 4,
+    "views.open": 4,
+    "views.update": 4,
+}
+DEFAULT_TIER = 3
+
+# chat.postMessage는 tier가 아닌 별도 제한: 채널당 초당 1건 + 워크스페이스 전체 분당 수백 건
+SLACK_POST_MESSAGE_PER_MINUTE = int(os.getenv("SLACK_POST_MESSAGE_PER_MINUTE", "300"))
+SLACK_POST_MESSAGE_PER_CHANNEL_PER_SECOND = 1.0
+
+# 429 응답 시 Retry-After 만큼 기다린 뒤 다시 시도하는 최대 횟수
+SLACK_MAX_RETRIES = int(os.getenv("SLACK_MAX_RETRIES", "3"))
+
+# 채널별 버킷 정리 기준 (오래 쓰지 않은 채널 버킷 제거)
+_MAX_CHANNEL_BUCKETS = 10000
+
+
+class TokenBucket:
+    """
+    thread-safe token bucket
+    - reserve()는 토큰을 미리 예약하고 사용할 수 있는 시각까지의 대기 시간을 돌려줌 (호출 순서대로 처리)
+    - 실제 대기는 호출하는 쪽에서 time.sleep / asyncio.sleep으로 처리
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        :param rate: 초당 채워지는 토큰 수
+        :param capacity: 최대 토큰 수 (burst 허용량)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 할 시간(초) 반환
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float):
+        """
+        Retry-After 동안 이 버킷을 쓰는 모든 호출을 멈춤
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @property
+    def idle(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            tokens = self._tokens + (now - self._updated_at) * self.rate
+            return tokens >= self.capacity and now >= self._paused_until
+
+
+class SlackRateLimiter:
+    """
+    메서드 tier별 token bucket + chat.postMessage 채널별 bucket
+    - 동기 / 비동기 client가 같은 인스턴스를 공유하면 한도를 함께 계산함
+    - 메서드별 대기 시간 / 429 횟수 집계
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._method_buckets: Dict[str, TokenBucket] = {}
+        self._channel_buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def reserve(self, api_method: str, channel: Optional[str] = None) -> float:
+        """
+        호출 한 건의 토큰을 예약하고 기다려야 할 시간(초) 반환
+        """
+        wait = 0.0
+        if channel:
+            wait = self._channel_bucket_for(channel).reserve()
+        return max(wait, self._bucket_for(api_method).reserve())
+
+    def pause(self, api_method: str, channel: Optional[str], seconds: float):
+        """
+        429 Retry-After 동안 같은 메서드(채널) 호출 전체를 멈춤
+        """
+        self._bucket_for(api_method).pause(seconds)
+        if channel:
+            self._channel_bucket_for(channel).pause(seconds)
+
+    def record(self, api_method: str, waited: float, retries: int, rate_limited: bool = False):
+        waited_ms = round(waited * 1000, 1)
+        with self._lock:
+            stat = self._stats.setdefault(api_method, {
+                "calls": 0, "rate_limited": 0, "retries": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0
+            })
+            stat["calls"] += 1
+            stat["rate_limited"] += retries + (1 if rate_limited else 0)
+            stat["retries"] += retries
+            stat["total_wait_ms"] += waited_ms
+            stat["max_wait_ms"] = max(stat["max_wait_ms"], waited_ms)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        메서드별 호출 수 / 대기 시간(ms) / 429 재시도 수
+        """
+        with self._lock:
+            return {
+                method: {
+                    **stat,
+                    "avg_wait_ms": round(stat["total_wait_ms"] / stat["calls"], 1) if stat["calls"] else 0.0,
+                }
+                for method, stat in self._stats.items()
+            }
+
+    def _bucket_for(self, api_method: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._method_buckets.get(api_method)
+            if bucket is None:
+                if api_method == "chat.postMessage":
+                    per_minute = SLACK_POST_MESSAGE_PER_MINUTE
+                else:
+                    per_minute = SLACK_TIER_PER_MINUTE[SLACK_METHOD_TIERS.get(api_method, DEFAULT_TIER)]
+                # 분당 한도를 초 단위로 나눠 채움 (burst는 최대 10건)
+                bucket = TokenBucket(rate=per_minute / 60, capacity=min(per_minute, 10))
+                self._method_buckets[api_method] = bucket
+            return bucket
+
+    def _channel_bucket_for(self, channel: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._channel_buckets.get(channel)
+            if bucket is None:
+                if len(self._channel_buckets) >= _MAX_CHANNEL_BUCKETS:
+                    self._channel_buckets = {k: v for k, v in self._channel_buckets.items() if not v.idle}
+                bucket = TokenBucket(rate=SLACK_POST_MESSAGE_PER_CHANNEL_PER_SECOND, capacity=1)
+                self._channel_buckets[channel] = bucket
+            return bucket
+
+    @staticmethod
+    def channel_of(api_method: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        채널 단위 제한은 chat.postMessage에만 적용
+        """
+        if api_method != "chat.postMessage":
+            return None
+        body = kwargs.get("json") or kwargs.get("data") or kwargs.get("params") or {}
+        return body.get("channel")
+
+
+class RateLimitedWebClient(WebClient):
+    """
+    SlackRateLimiter를 거쳐 호출하는 Slack WebClient
+    - 한도를 넘는 호출은 실패시키지 않고 대기열처럼 기다렸다가 전송
+    - 429 응답은 Retry-After만큼 같은 버킷 전체를 멈춘 뒤 재시도
+    """
+
+    def __init__(self, *args, rate_limiter: Optional[SlackRateLimiter] = None,
+                 max_retries: int = SLACK_MAX_RETRIES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter or SlackRateLimiter()
+        self.max_retries = max_retries
+
+    def api_call(self, api_method: str, **kwargs) -> SlackResponse:
+        channel = self.rate_limiter.channel_of(api_method, kwargs)
+        retries = 0
+        waited = 0.0
+
+        while True:
+            wait = self.rate_limiter.reserve(api_method, channel)
+            if wait > 0:
+                time.sleep(wait)
+            waited += wait
+
+            try:
+                response = super().api_call(api_method, **kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429 or retries >= self.max_retries:
+                    self.rate_limiter.record(api_method, waited, retries, rate_limited=e.response.status_code == 429)
+                    raise
+
+                self.rate_limiter.pause(api_method, channel, float(e.response.headers.get("Retry-After", 1)))
+                retries += 1
+                continue
+
+            self.rate_limiter.record(api_method, waited, retries)
+            return response
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.rate_limiter.get_stats()
+
+
+class AsyncRateLimitedWebClient(AsyncWebClient):
+    """
+    RateLimitedWebClient의 asyncio 버전 - 대기는 asyncio.sleep으로 처리해 이벤트 루프를 막지 않음
+    """
+
+    def __init__(self, *args, rate_limiter: Optional[SlackRateLimiter] = None,
+                 max_retries: int = SLACK_MAX_RETRIES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter or SlackRateLimiter()
+        self.max_retries = max_retries
+
+    async def api_call(self, api_method: str, **kwargs) -> AsyncSlackResponse:
+        channel = self.rate_limiter.channel_of(api_method, kwargs)
+        retries = 0
+        waited = 0.0
+
+        while True:
+            wait = self.rate_limiter.reserve(api_method, channel)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            waited += wait
+
+            try:
+                response = await super().api_call(api_method, **kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429 or retries >= self.max_retries:
+                    self.rate_limiter.record(api_method, waited, retries, rate_limited=e.response.status_code == 429)
+                    raise
+
+                self.rate_limiter.pause(api_method, channel, float(e.response.headers.get("Retry-After", 1)))
+                retries += 1
+                continue
+
+            self.rate_limiter.record(api_method, waited, retries)
+            return response
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.rate_limiter.get_stats()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from pydantic import BaseModel
 
 
@@ -39,4 +39,63 @@ class SettingCreateSchema(BaseModel):
     due_date: Optional[datetime] = None
     completed_date: Optional[datetime] = None
 
-    is_computer: bool = False
\ No newline at end of file
+    is_computer: bool = False
+
+SettingStatusValue = Literal["pending", "shipped", "setting", "completed"]
+CompanyValue = Literal["core", "bank", "insu"]
+OnboardingTypeValue = Literal["pending", "new", "replace", "rejoin", "switch"]
+SettingOrderBy = Literal[
+    "-created_at", "created_at",
+    "-due_date", "due_date",
+    "-requested_date", "requested_date",
+]
+
+
+class SettingListQuery(BaseModel):
+    """
+    GET /settings 필터 / 정렬 조건
+    - 여러 값은 ?status=pending&status=setting 처럼 반복 전달
+    """
+    status: Optional[List[SettingStatusValue]] = None
+    company: Optional[List[CompanyValue]] = None
+    onboarding_type: Optional[List[OnboardingTypeValue]] = None
+    urgency: Optional[bool] = None
+    assignee_name: Optional[str] = None
+
+    # 일정 범위 (이상 / 이하)
+    requested_date_from: Optional[datetime] = None
+    requested_date_to: Optional[datetime] = None
+    due_date_from: Optional[datetime] = None
+    due_date_to: Optional[datetime] = None
+
+    order_by: SettingOrderBy = "-created_at"
+
+    def to_filters(self) -> Dict[str, Any]:
+        """
+        MongoEngine 필터로 변환
+        """
+        filters = {}
+
+        for field in ("status", "company", "onboarding_type"):
+            values = getattr(self, field)
+            if not values:
+                continue
+            if len(values) == 1:
+                filters[field] = values[0]
+            else:
+                filters[f"{field}__in"] = values
+
+        if self.urgency is not None:
+            filters["urgency"] = self.urgency
+        if self.assignee_name:
+            filters["assignee_name"] = self.assignee_name
+
+        for field in ("requested_date", "due_date"):
+            start = getattr(self, f"{field}_from")
+            end = getattr(self, f"{field}_to")
+            if start:
+                filters[f"{field}__gte"] = start
+            if end:
+                filters[f"{field}__lte"] = end
+
+        return filters
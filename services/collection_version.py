@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+from models.collection_version import CollectionVersion
+
+
+class CollectionVersionService:
+    """
+    컬렉션 버전 카운터
+    - 쓰기 경로는 데이터 변경 후 bump() 호출
+    - 읽기 경로는 데이터보다 먼저 get()으로 버전을 읽음
+      (사이에 변경이 끼어도 ETag가 더 오래된 버전을 가리키므로 다음 요청에서 다시 조회됨)
+    """
+
+    @staticmethod
+    def get(name: str) -> int:
+        doc = CollectionVersion.objects(name=name).only("version").as_pymongo().first()
+        return doc.get("version", 0) if doc else 0
+
+    @staticmethod
+    def get_updated_at(name: str) -> Optional[datetime]:
+        """
+        마지막 bump 시각
+        """
+        doc = CollectionVersion.objects(name=name).only("updated_at").as_pymongo().first()
+        return doc.get("updated_at") if doc else None
+
+    @staticmethod
+    def bump(name: str):
+        CollectionVersion.objects(name=name).update_one(
+            upsert=True,
+            inc__version=1,
+            set__updated_at=datetime.utcnow()
+        )
@@ -0,0 +1,6 @@
+from models.computer import Computer
+from services.crud_base import CrudBase
+
+
+class ComputerService(CrudBase):
+    model = Computer
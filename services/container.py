@@ -0,0 +1,61 @@
+import threading
+from typing import Optional
+from slack_sdk import WebClient
+from common.slack import SlackBotName
+from modules.okta import OktaClient
+from modules.slack import BoltApp
+from services.setting import SettingService
+
+
+class ServiceContainer:
+    """
+    프로세스 단위로 한 번만 만드는 외부 클라이언트 / 서비스 묶음
+    - Okta 세션(커넥션 풀), Slack WebClient를 요청마다 새로 만들지 않고 재사용
+    """
+
+    def __init__(self, okta_client: Optional[OktaClient] = None, slack_bot: Optional[WebClient] = None):
+        self.okta_client = okta_client or OktaClient()
+        self.slack_bot = slack_bot or BoltApp(SlackBotName.SETTING_BOT).client
+        self.setting_service = SettingService(okta_client=self.okta_client, slack_bot=self.slack_bot)
+
+    def close(self):
+        self.okta_client.session.close()
+
+
+_container: Optional[ServiceContainer] = None
+_container_lock = threading.Lock()
+
+
+def init_container(container: Optional[ServiceContainer] = None) -> ServiceContainer:
+    """
+    서버 시작 시(lifespan) 호출 - 테스트 등에서는 미리 만든 container를 넘겨 교체 가능
+    """
+    global _container
+    with _container_lock:
+        if container is not None:
+            _container = container
+        elif _container is None:
+            _container = ServiceContainer()
+        return _container
+
+
+def get_container() -> ServiceContainer:
+    """
+    lifespan 밖(Airflow 스크립트, 작업 워커 등)에서 호출되면 처음 한 번 생성
+    """
+    return _container or init_container()
+
+
+def close_container():
+    global _container
+    with _container_lock:
+        if _container is not None:
+            _container.close()
+            _container = None
+
+
+def get_setting_service() -> SettingService:
+    """
+    FastAPI dependency
+    """
+    return get_container().setting_service
@@ -1,6 +1,8 @@
-from typing import Type, Optional, Dict, Any, List
-from mongoengine import Document
-from common.serializers import serialize_mongo
+from typing import Type, Optional, Dict, Any, List, Iterator
+from mongoengine import Document, Q
+from common.exceptions import BadRequestError
+from common.pagination import encode_cursor, decode_cursor
+from common.serializers import serialize_mongo, serialize_bson
 
 
 class CrudBase:
@@ -10,22 +12,35 @@ class CrudBase:
     def create(cls, data: Dict[str, Any]) -> str:
         obj = cls.model(**data)
         obj.save()
+        cls._after_write("created", str(obj.id), data)
         return str(obj.id)
 
     @classmethod
-    def get(cls, doc_id: str):
+    def get(cls, doc_id: str, raw: bool = False):
+        """
+        :param raw: True면 MongoEngine Document를 만들지 않고 PyMongo dict를 바로 직렬화
+        """
+        if raw:
+            doc = cls.model.objects(id=doc_id).as_pymongo().first()
+            return serialize_bson(doc) if doc else None
+
         obj = cls.model.objects(id=doc_id).first()
         if not obj:
             return None
 
-        data = obj.to_mongo().to_dict()
-        data["id"] = str(obj.id)
-        data.pop("_id", None)
-
-        return serialize_mongo(data)
+        return cls._serialize(obj)
 
     @classmethod
-    def list(cls, filters: Optional[Dict[str, Any]] = None, order_by: Optional[str] = None):
+    def list(
+            cls,
+            filters: Optional[Dict[str, Any]] = None,
+            order_by: Optional[str] = None,
+            fields: Optional[List[str]] = None,
+            raw: bool = False
+    ):
+        """
+        :param raw: True면 MongoEngine Document를 만들지 않고 PyMongo dict를 바로 직렬화
+        """
         filters = filters or {}
         results = []
 
@@ -34,22 +49,189 @@ class CrudBase:
         if order_by:
             qs = qs.order_by(order_by)
 
-        for obj in qs:
-            data = obj.to_mongo().to_dict()
-            data["id"] = str(obj.id)
-            data.pop("_id", None)
+        if fields:
+            qs = qs.only(*cls._validate_fields(fields))
+
+        if raw:
+            return [serialize_bson(doc, fields) for doc in qs.as_pymongo()]
 
-            results.append(serialize_mongo(data))
+        for obj in qs:
+            results.append(cls._serialize(obj, fields))
 
         return results
 
+    @classmethod
+    def paginate(
+            cls,
+            filters: Optional[Dict[str, Any]] = None,
+            order_by: str = "-id",
+            limit: int = 50,
+            cursor: Optional[str] = None,
+            fields: Optional[List[str]] = None,
+            raw: bool = False
+    ) -> Dict[str, Any]:
+        """
+        keyset(cursor) 기반 페이지네이션
+        - (정렬 필드, _id) 이후의 문서만 조회하므로 skip 없이 페이지 크기만큼만 읽음
+
+        :param filters: MongoEngine 필터
+        :param order_by: 정렬 필드 하나 (예. '-created_at'), _id가 tie-breaker로 자동 추가됨
+        :param limit: 페이지 크기
+        :param cursor: 이전 응답의 next_cursor
+        :param fields: 응답에 포함할 필드 목록 (없으면 전체)
+        :param raw: True면 MongoEngine Document를 만들지 않고 PyMongo dict를 바로 직렬화
+        :return: {"items": [...], "next_cursor": str | None}
+        """
+        descending = order_by.startswith("-")
+        sort_field = order_by.lstrip("+-")
+        if sort_field == "_id":
+            sort_field = "id"
+        if sort_field not in cls.model._fields:
+            raise BadRequestError(f"Invalid order_by field: {sort_field}")
+
+        qs = cls.model.objects(**(filters or {}))
+
+        if cursor:
+            last_id, last_value = decode_cursor(cursor)
+            qs = qs.filter(cls._keyset_query(sort_field, descending, last_id, last_value))
+
+        direction = "-" if descending else "+"
+        if sort_field == "id":
+            qs = qs.order_by(f"{direction}id")
+        else:
+            qs = qs.order_by(f"{direction}{sort_field}", f"{direction}id")
+
+        if fields:
+            qs = qs.only(*cls._validate_fields(fields), sort_field)
+
+        qs = qs.limit(limit + 1)
+        if raw:
+            qs = qs.as_pymongo()
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        objs = list(qs)
+        has_next = len(objs) > limit
+        objs = objs[:limit]
+
+        next_cursor = None
+        if has_next and objs:
+            last = objs[-1]
+            if raw:
+                last_id = last["_id"]
+                last_value = None if sort_field == "id" else last.get(cls.model._fields[sort_field].db_field)
+            else:
+                last_id = last.id
+                last_value = None if sort_field == "id" else getattr(last, sort_field)
+            next_cursor = encode_cursor(last_id, last_value)
+
+        if raw:
+            items = [serialize_bson(doc, fields) for doc in objs]
+        else:
+            items = [cls._serialize(obj, fields) for obj in objs]
+
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+        }
+
+    @classmethod
+    def export(
+            cls,
+            filters: Optional[Dict[str, Any]] = None,
+            order_by: Optional[str] = None,
+            fields: Optional[List[str]] = None,
+            batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        전체 문서를 커서에서 한 건씩 꺼내 JSON-safe dict로 반환하는 generator
+        - 결과를 리스트로 모으지 않으므로 컬렉션 크기와 무관하게 메모리 사용량이 일정함
+        """
+        qs = cls.model.objects(**(filters or {}))
+
+        if order_by:
+            qs = qs.order_by(order_by)
+
+        if fields:
+            qs = qs.only(*cls._validate_fields(fields))
+
+        for doc in qs.batch_size(batch_size).as_pymongo():
+            yield serialize_bson(doc, fields)
+
+    @classmethod
+    def export_columns(cls, fields: Optional[List[str]] = None) -> List[str]:
+        """
+        CSV 컬럼 순서 (id + 모델 필드 정의 순서)
+        """
+        if fields:
+            return ["id"] + [f for f in cls._validate_fields(fields) if f != "id"]
+        return ["id"] + [f for f in cls.model._fields_ordered if f != "id"]
+
     @classmethod
     def update(cls, doc_id: str, data: Dict[str, Any]) -> bool:
         result = cls.model.objects(id=doc_id).update_one(**{
             f"set__{k}": v for k, v in data.items()
         })
+        if result > 0:
+            cls._after_write("updated", doc_id, data)
         return result > 0
 
     @classmethod
     def delete(cls, doc_id: str) -> bool:
-        return cls.model.objects(id=doc_id).delete() > 0
+        deleted = cls.model.objects(id=doc_id).delete() > 0
+        if deleted:
+            cls._after_write("deleted", doc_id)
+        return deleted
+
+    @classmethod
+    def _after_write(cls, action: str, doc_id: str, data: Optional[Dict[str, Any]] = None):
+        """
+        create / update / delete로 문서가 바뀐 뒤 호출되는 hook (서비스별로 재정의)
+        :param action: 'created' | 'updated' | 'deleted'
+        :param data: 생성 / 변경에 사용한 값
+        """
+        pass
+
+    @classmethod
+    def _serialize(cls, obj, fields: Optional[List[str]] = None):
+        data = obj.to_mongo().to_dict()
+        data["id"] = str(obj.id)
+        data.pop("_id", None)
+
+        # only()로 불러오지 않은 필드에는 기본값이 채워지므로 요청한 필드만 남김
+        if fields:
+            data = {k: v for k, v in data.items() if k == "id" or k in fields}
+
+        return serialize_mongo(data)
+
+    @classmethod
+    def _validate_fields(cls, fields: List[str]) -> List[str]:
+        unknown = [f for f in fields if f not in cls.model._fields]
+        if unknown:
+            raise BadRequestError(f"Unknown fields: {', '.join(unknown)}")
+        return fields
+
+    @staticmethod
+    def _keyset_query(sort_field: str, descending: bool, last_id, last_value) -> Q:
+        """
+        커서 이후 문서 조건
+        - 정렬 값이 같은 문서는 _id로 구분
+        - MongoDB는 null(누락 포함)을 가장 작은 값으로 정렬함
+        """
+        op = "lt" if descending else "gt"
+        after_id = Q(**{f"id__{op}": last_id})
+
+        if sort_field == "id":
+            return after_id
+
+        same_value = Q(**{sort_field: last_value}) & after_id
+
+        if last_value is None:
+            # 내림차순: null 구간이 마지막 / 오름차순: null 구간 다음에 값이 있는 문서
+            if descending:
+                return same_value
+            return same_value | Q(**{f"{sort_field}__ne": None})
+
+        after_value = Q(**{f"{sort_field}__{op}": last_value})
+        if descending:
+            return after_value | same_value | Q(**{sort_field: None})
+        return after_value | same_value
@@ -1,6 +1,180 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
 from models.employee import Employee
 from services.crud_base import CrudBase
 
 
+# 캐시된 Employee 유지 시간 / 최대 개수
+EMPLOYEE_CACHE_TTL_SECONDS = float(os.getenv("EMPLOYEE_CACHE_TTL_SECONDS", "300"))
+EMPLOYEE_CACHE_MAX_SIZE = int(os.getenv("EMPLOYEE_CACHE_MAX_SIZE", "5000"))
+
+# 조회 키로 쓰는 Employee 필드
+CACHE_KEYS = ("email", "slack_id", "okta_user_id")
+
+
+class EmployeeCache:
+    """
+    Employee 문서 TTL + LRU 캐시 (프로세스 내부)
+    - email / slack_id / okta_user_id 어느 키로 조회해도 같은 항목을 사용
+    - EmployeeService.create / update / delete에서 무효화, 다른 프로세스의 변경은 TTL로 반영
+    - 캐시된 Document는 여러 스레드가 공유하므로 읽기 전용으로 사용할 것
+    """
+
+    def __init__(self, ttl: float = EMPLOYEE_CACHE_TTL_SECONDS, max_size: int = EMPLOYEE_CACHE_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # employee id -> (Employee, 만료 시각)
+        self._entries: "OrderedDict[str, Tuple[Employee, float]]" = OrderedDict()
+        # (키 이름, 값) -> employee id
+        self._index: Dict[Tuple[str, str], str] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_by_email(self, email: str) -> Optional[Employee]:
+        return self._get("email", email)
+
+    def get_by_slack_id(self, slack_id: str) -> Optional[Employee]:
+        return self._get("slack_id", slack_id)
+
+    def get_by_okta_user_id(self, okta_user_id: str) -> Optional[Employee]:
+        return self._get("okta_user_id", okta_user_id)
+
+    def get_many_by_email(self, emails: Iterable[str]) -> Dict[str, Employee]:
+        """
+        여러 사용자 조회 - 캐시에 없는 사용자만 email__in 쿼리 한 번으로 조회
+        :return: {email: Employee} (존재하지 않는 email은 제외)
+        """
+        result = {}
+        missing = []
+        for email in dict.fromkeys(emails):
+            if not email:
+                continue
+            employee = self._lookup("email", email)
+            if employee is None:
+                missing.append(email)
+            else:
+                result[email] = employee
+
+        if missing:
+            for employee in Employee.objects(email__in=missing):
+                self._put(employee)
+                result[employee.email] = employee
+
+        return result
+
+    def invalidate(self, employee_id: str):
+        """
+        해당 Employee의 모든 키 제거
+        """
+        with self._lock:
+            self._remove(str(employee_id))
+
+    def invalidate_key(self, field: str, value: str):
+        with self._lock:
+            employee_id = self._index.get((field, value))
+            if employee_id:
+                self._remove(employee_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _get(self, field: str, value: str) -> Optional[Employee]:
+        if not value:
+            return None
+
+        employee = self._lookup(field, value)
+        if employee is not None:
+            return employee
+
+        employee = Employee.objects(**{field: value}).first()
+        if employee is not None:
+            self._put(employee)
+        return employee
+
+    def _lookup(self, field: str, value: str) -> Optional[Employee]:
+        """
+        캐시에서만 조회하고 hit / miss 집계
+        """
+        with self._lock:
+            employee_id = self._index.get((field, value))
+            entry = self._entries.get(employee_id) if employee_id else None
+
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    self._remove(employee_id)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(employee_id)
+            self._hits += 1
+            return entry[0]
+
+    def _put(self, employee: Employee):
+        employee_id = str(employee.id)
+        with self._lock:
+            self._remove(employee_id)
+            self._entries[employee_id] = (employee, time.monotonic() + self.ttl)
+            for field in CACHE_KEYS:
+                value = getattr(employee, field, None)
+                if value:
+                    self._index[(field, value)] = employee_id
+
+            while len(self._entries) > self.max_size:
+                oldest_id = next(iter(self._entries))
+                self._remove(oldest_id)
+
+    def _remove(self, employee_id: str):
+        """
+        lock을 잡은 상태에서 호출
+        """
+        entry = self._entries.pop(employee_id, None)
+        if entry is None:
+            return
+        for field in CACHE_KEYS:
+            value = getattr(entry[0], field, None)
+            if value and self._index.get((field, value)) == employee_id:
+                del self._index[(field, value)]
+
+
+employee_cache = EmployeeCache()
+
+
 class EmployeeService(CrudBase):
-    model = Employee
\ No newline at end of file
+    model = Employee
+
+    @classmethod
+    def create(cls, data: Dict[str, Any]) -> str:
+        employee_id = super().create(data)
+        # 같은 email로 남아 있던 항목(다른 프로세스에서 삭제된 사용자 등) 제거
+        employee_cache.invalidate_key("email", data.get("email"))
+        return employee_id
+
+    @classmethod
+    def update(cls, doc_id: str, data: Dict[str, Any]) -> bool:
+        updated = super().update(doc_id, data)
+        employee_cache.invalidate(doc_id)
+        return updated
+
+    @classmethod
+    def delete(cls, doc_id: str) -> bool:
+        deleted = super().delete(doc_id)
+        employee_cache.invalidate(doc_id)
+        return deleted
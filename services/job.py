@@ -0,0 +1,220 @@
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from mongoengine import Q
+from models.job import QuickActionJob, JobItem, JobStatus
+from models.setting import QuickActionStatus
+from services.crud_base import CrudBase
+from services.container import get_setting_service
+
+
+# 동시에 실행할 일괄 작업 수 (작업 하나 안에서도 QUICK_ACTION_MAX_WORKERS만큼 병렬 실행됨)
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "2"))
+
+# 실행 중인 작업의 lease 유지 시간 (프로세스가 죽으면 이 시간이 지난 뒤 다음 시작 시 회수)
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "120"))
+JOB_HEARTBEAT_SECONDS = JOB_LEASE_SECONDS / 3
+# 회수 후 다시 실행할 최대 횟수 (초과하면 error 처리 - 프로세스를 죽이는 작업이 반복 실행되지 않도록)
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "2"))
+
+# 액션 이름 -> SettingService 메서드 이름
+QUICK_ACTIONS = {
+    "win-setting": "win_setting",
+    "okta-setting": "okta_setting",
+    "o365-intune": "o365_setting",
+    "password-notice": "password_notice",
+    "pickup-notice": "pickup_notice",
+    "okta-activate": "okta_activate",
+}
+
+_executor = ThreadPoolExecutor(max_workers=JOB_MAX_WORKERS, thread_name_prefix="quick-action-job")
+
+
+class JobService(CrudBase):
+    model = QuickActionJob
+
+    @classmethod
+    def enqueue(cls, action: str, setting_ids: List[str], requested_by: Optional[str] = None) -> str:
+        """
+        일괄 빠른 실행을 작업으로 저장하고 워커 풀에 넘긴 뒤 바로 job id 반환
+        """
+        if action not in QUICK_ACTIONS:
+            raise ValueError(f"Unknown quick action: {action}")
+
+        job = QuickActionJob(
+            action=action,
+            setting_ids=setting_ids,
+            requested_by=requested_by,
+            items=[JobItem(setting_id=setting_id) for setting_id in dict.fromkeys(setting_ids)],
+        )
+        job.save()
+
+        _executor.submit(cls.run, str(job.id))
+        cls._resubmit_expired()
+        return str(job.id)
+
+    @classmethod
+    def run(cls, job_id: str):
+        """
+        대기 중인 작업 하나 실행
+        - queued -> running 전환을 원자적으로 처리해 같은 작업이 두 번 실행되지 않도록 함
+        - 실행 중에는 하트비트로 lease를 연장, 완료 / 실패 기록은 lease를 가진 경우에만 반영
+          (lease가 만료되어 다른 프로세스가 회수한 작업을 덮어쓰지 않도록)
+        """
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        now = datetime.utcnow()
+        job = QuickActionJob.objects(id=job_id, status=JobStatus.QUEUED).modify(
+            set__status=JobStatus.RUNNING,
+            set__started_at=now,
+            set__locked_by=owner,
+            set__locked_until=now + timedelta(seconds=JOB_LEASE_SECONDS),
+            inc__attempts=1,
+            new=True
+        )
+        if not job:
+            return
+
+        stop = threading.Event()
+        threading.Thread(
+            target=cls._heartbeat, args=(job_id, owner, stop), name=f"quick-action-job-heartbeat-{job_id}", daemon=True
+        ).start()
+
+        try:
+            service = get_setting_service()
+            execute = getattr(service, QUICK_ACTIONS[job.action])
+            # 회수된 작업은 아직 시작하지 않은 Setting만 실행 (완료 / 중단된 항목은 다시 실행하지 않음)
+            pending_ids = [item.setting_id for item in job.items if item.status == QuickActionStatus.PENDING]
+            result = execute(
+                pending_ids,
+                job.requested_by,
+                on_progress=lambda setting_id, status, error_message: cls._update_item(job_id, setting_id, status, error_message)
+            )
+            QuickActionJob.objects(id=job_id, locked_by=owner).update_one(
+                set__status=JobStatus.DONE,
+                set__result=result,
+                set__finished_at=datetime.utcnow(),
+                set__locked_by=None,
+                set__locked_until=None
+            )
+        except Exception as e:
+            QuickActionJob.objects(id=job_id, locked_by=owner).update_one(
+                set__status=JobStatus.ERROR,
+                set__error_message=str(e),
+                set__finished_at=datetime.utcnow(),
+                set__locked_by=None,
+                set__locked_until=None
+            )
+        finally:
+            stop.set()
+
+    @classmethod
+    def resume_queued(cls) -> int:
+        """
+        서버 재시작 등으로 실행되지 못한 대기 작업을 다시 워커 풀에 등록
+        - lease가 만료된 실행 중 작업(프로세스 종료 등)은 회수해 남은 항목만 다시 실행 (reclaim_expired)
+        """
+        cls.reclaim_expired()
+
+        job_ids = [str(job_id) for job_id in QuickActionJob.objects(status=JobStatus.QUEUED).order_by("created_at").scalar("id")]
+        for job_id in job_ids:
+            _executor.submit(cls.run, job_id)
+        return len(job_ids)
+
+    @classmethod
+    def reclaim_expired(cls) -> List[str]:
+        """
+        lease가 만료된 running 작업 회수
+        - progress 항목은 외부 작업(비밀번호 초기화, DM 등)이 실행됐는지 알 수 없으므로 다시 실행하지 않고 error 처리
+        - done / error 항목은 그대로 두고, pending 항목이 남아 있으면 대기 상태로 되돌림
+        - 남은 항목이 없거나 JOB_MAX_ATTEMPTS번 시작했던 작업은 error 처리
+        - lease를 확인하는 조건부 modify라 여러 프로세스가 동시에 호출해도 한 번만 반영
+        :return: 대기 상태로 되돌린 job id 목록
+        """
+        now = datetime.utcnow()
+        expired = Q(status=JobStatus.RUNNING) & (Q(locked_until=None) | Q(locked_until__lt=now))
+
+        requeued = []
+        for job in QuickActionJob.objects(expired):
+            items = []
+            for item in job.items:
+                if item.status == QuickActionStatus.PROGRESS:
+                    item = JobItem(
+                        setting_id=item.setting_id,
+                        status=QuickActionStatus.ERROR,
+                        error_message="Interrupted while running (not retried)"
+                    )
+                items.append(item)
+
+            retry = (job.attempts or 0) < JOB_MAX_ATTEMPTS and any(
+                item.status == QuickActionStatus.PENDING for item in items
+            )
+            update = {"set__items": items, "set__locked_by": None, "set__locked_until": None}
+            if retry:
+                update["set__status"] = JobStatus.QUEUED
+            else:
+                update.update(
+                    set__status=JobStatus.ERROR,
+                    set__error_message="Job worker stopped before finishing",
+                    set__finished_at=now
+                )
+
+            reclaimed = QuickActionJob.objects(
+                id=job.id, status=JobStatus.RUNNING, locked_by=job.locked_by, locked_until=job.locked_until
+            ).update_one(**update)
+            if reclaimed and retry:
+                requeued.append(str(job.id))
+
+        return requeued
+
+    @classmethod
+    def get_status(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 + Setting별 진행 상태 집계
+        """
+        cls._resubmit_expired()
+
+        job = cls.get(job_id, raw=True)
+        if not job:
+            return None
+
+        counts = {status.value: 0 for status in QuickActionStatus if status != QuickActionStatus.NA}
+        for item in job.get("items", []):
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+
+        job["counts"] = counts
+        return job
+
+    @classmethod
+    def _resubmit_expired(cls):
+        """
+        다른 프로세스가 죽어 남은 작업을 이 프로세스에서 이어서 실행 (enqueue / get_status 때마다 확인)
+        """
+        for job_id in cls.reclaim_expired():
+            _executor.submit(cls.run, job_id)
+
+    @staticmethod
+    def _heartbeat(job_id: str, owner: str, stop: threading.Event):
+        """
+        작업이 끝날 때까지 lease 연장 (회수되어 lease를 잃으면 중단)
+        """
+        while not stop.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                extended = QuickActionJob.objects(id=job_id, locked_by=owner, status=JobStatus.RUNNING).update_one(
+                    set__locked_until=datetime.utcnow() + timedelta(seconds=JOB_LEASE_SECONDS)
+                )
+            except Exception as e:
+                print(f"Job heartbeat error: {e}")
+                continue
+            if not extended:
+                return
+
+    @staticmethod
+    def _update_item(job_id: str, setting_id: str, status: QuickActionStatus, error_message: Optional[str]):
+        QuickActionJob.objects(id=job_id, items__setting_id=setting_id).update_one(
+            set__items__S__status=status,
+            set__items__S__error_message=error_message
+        )
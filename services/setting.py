@@ -1,8 +1,18 @@
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from models.setting import Setting, QuickActionStatus, QuickAction
+from typing import List, Dict, Any, Optional, Callable
+from bson import ObjectId
+from mongoengine import ValidationError
+from mongoengine.errors import InvalidQueryError, LookUpError
+from mongoengine.queryset.transform import update as transform_update
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from slack_sdk import WebClient
+from models.setting import Setting, SettingStatus, OnboardingType, QuickActionStatus, QuickAction
 from models.computer import Computer, ComputerStatus
-from models.employee import Employee
+from models.employee import Employee, Company
 from modules.slack import BoltApp
 from modules.okta import OktaClient
 from modules.password import generate_password_for_week
@@ -11,27 +21,50 @@ from common.okta import OktaGroups
 from common.slack import SlackBotName
 from common.exceptions import NotFoundError
 from schemas.setting import SettingCreateSchema
+from services.collection_version import CollectionVersionService
 from services.crud_base import CrudBase
+from services.employee import employee_cache
+from services.setting_events import EventType, publish_local
+from services.setting_summary import SettingSummaryService
+
+
+# (setting_id, status, error_message)
+ProgressCallback = Optional[Callable[[str, QuickActionStatus, Optional[str]], None]]
+
+# 빠른 실행 시 외부 API(Slack / Okta)를 동시에 호출할 최대 스레드 수 (1이면 순차 실행)
+QUICK_ACTION_MAX_WORKERS = int(os.getenv("QUICK_ACTION_MAX_WORKERS", "8"))
 
 
 class SettingService(CrudBase):
     model = Setting
 
-    def __init__(self):
-        self.okta_client = OktaClient()
-        self.slack_bot = BoltApp(SlackBotName.SETTING_BOT).client
-        self.SINGLE_EXECUTABLE_STATUS = {
-            QuickActionStatus.PENDING,
-            QuickActionStatus.ERROR,
-            QuickActionStatus.PROGRESS,
-            QuickActionStatus.DONE
-        }
-        self.BULK_EXECUTABLE_STATUS = {
-            QuickActionStatus.PENDING,
-            QuickActionStatus.PROGRESS,
-            QuickActionStatus.ERROR
-        }
-
+    # 단건 실행 가능 상태
+    SINGLE_EXECUTABLE_STATUS = frozenset({
+        QuickActionStatus.PENDING,
+        QuickActionStatus.ERROR,
+        QuickActionStatus.PROGRESS,
+        QuickActionStatus.DONE
+    })
+    # 일괄 실행 가능 상태 (완료된 항목은 다시 실행하지 않음)
+    BULK_EXECUTABLE_STATUS = frozenset({
+        QuickActionStatus.PENDING,
+        QuickActionStatus.PROGRESS,
+        QuickActionStatus.ERROR
+    })
+
+    def __init__(
+            self,
+            okta_client: Optional[OktaClient] = None,
+            slack_bot: Optional[WebClient] = None,
+            max_workers: int = QUICK_ACTION_MAX_WORKERS
+    ):
+        """
+        :param okta_client: 재사용할 Okta 클라이언트 (없으면 새로 생성)
+        :param slack_bot: 재사용할 Slack WebClient (없으면 SETTING_BOT 클라이언트)
+        """
+        self.okta_client = okta_client or OktaClient()
+        self.slack_bot = slack_bot or BoltApp(SlackBotName.SETTING_BOT).client
+        self.max_workers = max(1, max_workers)
 
     @classmethod
     def create(cls, data: SettingCreateSchema):
@@ -41,7 +74,7 @@ class SettingService(CrudBase):
             if not computer:
                 raise NotFoundError("Computer not found")
 
-            user = Employee.objects(email=computer.user_email).first()
+            user = employee_cache.get_by_email(computer.user_email)
             setting = Setting(
                 user_name = computer.user_name,
                 user_email = computer.user_email,
@@ -62,7 +95,7 @@ class SettingService(CrudBase):
                 is_manual = True
             )
         else:
-            user = Employee.objects(email=data.user_email).first()
+            user = employee_cache.get_by_email(data.user_email)
             setting = Setting(
                 user_name = data.user_name,
                 user_email = data.user_email,
@@ -84,12 +117,36 @@ class SettingService(CrudBase):
             )
 
         setting.save()
+        SettingSummaryService.apply(added=[setting.to_mongo()])
+        cls._after_write("created", str(setting.id), cls._serialize(setting))
         return str(setting.id)
 
+    @classmethod
+    def update(cls, doc_id: str, data: Dict[str, Any]) -> bool:
+        """
+        단건 수정도 bulk_update와 같은 규칙으로 처리 (빠른 실행 재생성 / 요약 건수 / 이벤트)
+        """
+        result = cls.bulk_update([{"id": doc_id, "data": data}])
+        return result["updated_count"] > 0
+
+    @classmethod
+    def delete(cls, doc_id: str) -> bool:
+        """
+        삭제된 문서를 받아 요약 건수에서 뺌 (findOneAndDelete 1회)
+        """
+        setting = cls.model.objects(id=doc_id).modify(remove=True)
+        if not setting:
+            return False
+
+        SettingSummaryService.apply(removed=[setting.to_mongo()])
+        cls._after_write("deleted", doc_id)
+        return True
+
     @classmethod
     def bulk_update(cls, updates: List[Dict[str, Any]]):
         """
-        여러 Setting 문서를 개별 업데이트
+        여러 Setting 문서를 일괄 업데이트
+        - 대상 Setting 조회 1회 + bulk_write 1회 (+ 장비 상태 변경 update_many 1회)
 
         Body 예시:
         {
@@ -103,7 +160,9 @@ class SettingService(CrudBase):
             ]
         }
         """
-        results = []
+        # 같은 id가 여러 번 오면 순서대로 합쳐서 한 번만 갱신 (unordered bulk_write는 순서를 보장하지 않음)
+        merged: Dict[str, Dict[str, Any]] = {}
+        item_ids = []
 
         for item in updates:
             setting_id = item.get("id")
@@ -112,13 +171,28 @@ class SettingService(CrudBase):
             if not setting_id or not data:
                 continue
 
-            setting = cls.model.objects(id=setting_id).first()
+            item_ids.append(setting_id)
+            merged.setdefault(setting_id, {}).update(data)
+
+        # 대상 Setting 한 번에 조회
+        valid_ids = [setting_id for setting_id in merged if ObjectId.is_valid(setting_id)]
+        settings = {
+            str(setting.id): setting
+            for setting in cls.model.objects(id__in=valid_ids).only(
+                "os", "onboarding_type", "status", "is_manual", "serial", "quick_actions", "company"
+            )
+        } if valid_ids else {}
+
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        operations = []
+        operation_ids = []
+        changes: Dict[str, Dict[str, Any]] = {}
+        completed_serials = {}
+
+        for setting_id, data in merged.items():
+            setting = settings.get(setting_id)
             if not setting:
-                results.append({
-                    "id": setting_id,
-                    "updated": False,
-                    "reason": "not_found"
-                })
+                outcomes[setting_id] = {"updated": False, "reason": "not_found"}
                 continue
 
             update_data = data.copy()
@@ -143,19 +217,55 @@ class SettingService(CrudBase):
                     prev_actions=setting.quick_actions
                 )
 
+            try:
+                # update_one(set__...)과 같은 변환 규칙으로 $set 문서 생성
+                update_doc = transform_update(cls.model, **{
+                    f"set__{k}": v for k, v in update_data.items()
+                })
+            except (InvalidQueryError, LookUpError, ValidationError) as e:
+                outcomes[setting_id] = {"updated": False, "reason": str(e)}
+                continue
+
+            operations.append(UpdateOne({"_id": setting.pk}, update_doc))
+            operation_ids.append(setting_id)
+            outcomes[setting_id] = {"updated": True}
+            changes[setting_id] = update_doc.get("$set", {})
+
             if not setting.is_manual and status_changed and data["status"] == "completed":
-                computer = Computer.objects(serial=setting.serial).first()
-                computer.status = ComputerStatus.USE
-                computer.save()
+                completed_serials[setting_id] = setting.serial
 
-            updated = cls.model.objects(id=setting_id).update_one(**{
-                f"set__{k}": v for k, v in update_data.items()
-            })
+        # 모든 Setting 변경을 한 번에 전송
+        if operations:
+            try:
+                cls.model._get_collection().bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    setting_id = operation_ids[error["index"]]
+                    outcomes[setting_id] = {"updated": False, "reason": error.get("errmsg")}
+                    completed_serials.pop(setting_id, None)
+
+            CollectionVersionService.bump(cls.model._get_collection_name())
+            updated_ids = [setting_id for setting_id in operation_ids if outcomes[setting_id]["updated"]]
+
+            # 요약 건수: 변경 전 문서를 빼고 변경 후 문서를 더함
+            before = {setting_id: settings[setting_id].to_mongo() for setting_id in updated_ids}
+            SettingSummaryService.apply(
+                added=[{**before[setting_id], **changes[setting_id]} for setting_id in updated_ids],
+                removed=before.values()
+            )
 
-            results.append({
-                "id": setting_id,
-                "updated": updated > 0
-            })
+            for setting_id in updated_ids:
+                publish_local(EventType.UPDATED, setting_id, {"updated_fields": changes[setting_id]})
+
+        # 세팅 완료된 자동 생성 건의 장비 상태를 한 번에 USE로 변경
+        # (updated_at도 갱신해야 다음 증분 동기화에서 Setting이 삭제됨)
+        if completed_serials:
+            Computer.objects(serial__in=list(completed_serials.values())).update(
+                set__status=ComputerStatus.USE,
+                set__updated_at=datetime.utcnow()
+            )
+
+        results = [{"id": setting_id, **outcomes[setting_id]} for setting_id in item_ids]
 
         return {
             "requested_count": len(updates),
@@ -163,329 +273,232 @@ class SettingService(CrudBase):
             "results": results
         }
 
-    def password_notice(self, setting_ids: List[str], requested_by: str = None):
-        fail_user_name = []
-        is_single = len(setting_ids) == 1
-
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
-            if not setting:
-                continue
-
-            quick_action = self._get_quick_action(setting, 'password-notice')
-            status = quick_action.status
-
-            # 실행 가능 여부 확인
-            if not self._is_executable(status=status, is_single=is_single):
-                # n/a일 경우: 상태 유지 + 에러 메시지만 기록
-                if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
-                continue
-
-            # 실행 시작 - progress
-            self._mark_quick_action_progress(
-                action=quick_action,
-                requested_by=requested_by,
+    def password_notice(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
+        def execute(setting: Setting, user: Employee):
+            # 슬랙 안내 DM 전송
+            self.slack_bot.chat_postMessage(
+                channel=user.slack_id,
+                text="Okta 비밀번호 초기화 예정",
+                blocks=password_notice_message_block(user_name=user.name)
             )
-            setting.save()
 
-            try:
-                user = Employee.objects(email=setting.user_email).first()
-                if not user:
-                    raise Exception("User not found")
+        return self._run_quick_action('password-notice', setting_ids, requested_by, execute, on_progress)
 
-                # 슬랙 안내 DM 전송
-                self.slack_bot.chat_postMessage(
-                    channel=user.slack_id,
-                    text="Okta 비밀번호 초기화 예정",
-                    blocks=password_notice_message_block(user_name=user.name)
-                )
-
-                # 성공 시
-                self._mark_quick_action_done(action=quick_action)
-            except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
-            finally:
-                setting.save()
-
-        return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
-
-    def pickup_notice(self, setting_ids: List[str], requested_by: str = None):
-        fail_user_name = []
-        is_single = len(setting_ids) == 1
-
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
-            if not setting:
-                continue
-
-            quick_action = self._get_quick_action(setting, 'pickup-notice')
-            status = quick_action.status
-
-            # 실행 가능 여부 확인
-            if not self._is_executable(status=status, is_single=is_single):
-                # n/a일 경우: 상태 유지 + 에러 메시지만 기록
-                if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
-                continue
-
-            # 실행 시작 - progress
-            self._mark_quick_action_progress(
-                action=quick_action,
-                requested_by=requested_by,
+    def pickup_notice(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
+        def execute(setting: Setting, user: Employee):
+            # 슬랙 안내 DM 전송
+            self.slack_bot.chat_postMessage(
+                channel=user.slack_id,
+                text="장비 수령 안내",
+                blocks=pickup_notice_message_block()
             )
-            setting.save()
-
-            try:
-                user = Employee.objects(email=setting.user_email).first()
-                if not user:
-                    raise Exception("User not found")
-
-                # 슬랙 안내 DM 전송
-                self.slack_bot.chat_postMessage(
-                    channel=user.slack_id,
-                    text="장비 수령 안내",
-                    blocks=pickup_notice_message_block()
-                )
 
-                self.slack_bot.chat_postMessage(
-                    channel=user.slack_id,
-                    text="수령 날짜 및 시간 선택",
-                    blocks=pickup_notice_button_block()
-                )
-
-                # 성공 시
-                self._mark_quick_action_done(action=quick_action)
-            except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
-            finally:
-                setting.save()
+            self.slack_bot.chat_postMessage(
+                channel=user.slack_id,
+                text="수령 날짜 및 시간 선택",
+                blocks=pickup_notice_button_block()
+            )
 
-        return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
+        return self._run_quick_action('pickup-notice', setting_ids, requested_by, execute, on_progress)
 
-    def okta_setting(self, setting_ids: List[str], requested_by: str = None):
+    def okta_setting(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
         """
         Okta Setting 그룹에 추가 및 비밀번호 재설정
         """
-        fail_user_name = []
-        is_single = len(setting_ids) == 1
-
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
-            if not setting:
-                continue
-
-            quick_action = self._get_quick_action(setting, 'okta-setting')
-            status = quick_action.status
-
-            # 실행 가능 여부 확인
-            if not self._is_executable(status=status, is_single=is_single):
-                # n/a일 경우: 상태 유지 + 에러 메시지만 기록
-                if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
-                continue
-
-            # 실행 시작 - progress
-            self._mark_quick_action_progress(
-                action=quick_action,
-                requested_by=requested_by,
+        # 같은 주기에는 모든 사용자가 같은 비밀번호를 받으므로 한 번만 계산
+        new_password = generate_password_for_week()
+
+        def execute(setting: Setting, user: Employee):
+            # okta-setting 그룹에 유저 추가
+            # res = self.okta_client.add_user_to_group(group_id=OktaGroups.ALL_SETTING, user_id=user.okta_user_id)
+            # if not res.ok:
+            #     raise Exception(res.error or "Okta Setting group assignment failed")
+
+            # OKTA 계정 비밀번호 초기화
+            # res = self.okta_client.admin_set_password(user_id=user.okta_user_id, new_password=new_password)
+            # if not res.ok:
+            #     raise Exception(res.error or "Okta password reset failed")
+
+            # 초기화 비밀번호 DM으로 전송
+            self.slack_bot.chat_postMessage(
+                channel=user.slack_id,
+                text="Okta 비밀번호 초기화 안내",
+                blocks=password_reset_message_block(new_password)
             )
-            setting.save()
-
-            try:
-                user = Employee.objects(email=setting.user_email).first()
-                if not user:
-                    raise Exception("User not found")
-
-                # okta-setting 그룹에 유저 추가
-                # res = self.okta_client.add_user_to_group(group_id=OktaGroups.ALL_SETTING, user_id=user.okta_user_id)
-                # if not res.ok:
-                #     raise Exception(res.error or "Okta Setting group assignment failed")
-
-                # OKTA 계정 비밀번호 초기화
-                new_password = generate_password_for_week()
-                # res = self.okta_client.admin_set_password(user_id=user.okta_user_id, new_password=new_password)
-                # if not res.ok:
-                #     raise Exception(res.error or "Okta password reset failed")
-
-                # 초기화 비밀번호 DM으로 전송
-                self.slack_bot.chat_postMessage(
-                    channel=user.slack_id,
-                    text="Okta 비밀번호 초기화 안내",
-                    blocks=password_reset_message_block(new_password)
-                )
 
-                # 성공 시
-                self._mark_quick_action_done(action=quick_action)
-            except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
-            finally:
-                setting.save()
+        return self._run_quick_action('okta-setting', setting_ids, requested_by, execute, on_progress)
 
-        return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
-
-    def win_setting(self, setting_ids: List[str], requested_by: str = None):
+    def win_setting(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
         """
         Okta Win Setting 그룹에 추가
         """
-        fail_user_name = []
-        is_single = len(setting_ids) == 1
+        def execute(setting: Setting, user: Employee):
+            # # win-setting 그룹에 유저 추가
+            # res = self.okta_client.add_user_to_group(group_id=OktaGroups.WIN_SETTING, user_id=user.okta_user_id)
+            # if not res.ok:
+            #     raise Exception(res.error or "Windows group assignment failed")
+            pass
 
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
-            if not setting:
-                continue
-
-            quick_action = self._get_quick_action(setting, 'win-setting')
-            status = quick_action.status
+        return self._run_quick_action('win-setting', setting_ids, requested_by, execute, on_progress)
 
-            # 실행 가능 여부 확인
-            if not self._is_executable(status=status, is_single=is_single):
-                # n/a일 경우: 상태 유지 + 에러 메시지만 기록
-                if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
-                continue
-
-            # 실행 시작 - progress
-            self._mark_quick_action_progress(
-                action=quick_action,
-                requested_by=requested_by,
-            )
-            setting.save()
-
-            try:
-                user = Employee.objects(email=setting.user_email).first()
-                if not user:
-                    raise Exception("User not found")
-
-                # # win-setting 그룹에 유저 추가
-                # res = self.okta_client.add_user_to_group(group_id=OktaGroups.WIN_SETTING, user_id=user.okta_user_id)
-                # if not res.ok:
-                #     raise Exception(res.error or "Windows group assignment failed")
-
-                # 성공 시
-                self._mark_quick_action_done(action=quick_action)
-            except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
-            finally:
-                setting.save()
-
-        return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
-
-    def o365_setting(self, setting_ids: List[str], requested_by: str = None):
+    def o365_setting(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
         """
         Okta o365 Intune 그룹에 추가
         """
-        fail_user_name = []
-        is_single = len(setting_ids) == 1
+        def execute(setting: Setting, user: Employee):
+            # # 계정 활성화
+            # res = self.okta_client.add_user_to_group(group_id=OktaGroups.O365_INTUNE, user_id=user.okta_user_id)
+            # if not res.ok:
+            #     raise Exception(res.error or "Intune group assignment failed")
+            pass
 
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
-            if not setting:
-                continue
-
-            quick_action = self._get_quick_action(setting, 'o365-intune')
-            status = quick_action.status
+        return self._run_quick_action('o365-intune', setting_ids, requested_by, execute, on_progress)
 
-            # 실행 가능 여부 확인
-            if not self._is_executable(status=status, is_single=is_single):
-                # n/a일 경우: 상태 유지 + 에러 메시지만 기록
-                if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
-                continue
-
-            # 실행 시작 - progress
-            self._mark_quick_action_progress(
-                action=quick_action,
-                requested_by=requested_by,
-            )
-            setting.save()
-
-            try:
-                user = Employee.objects(email=setting.user_email).first()
-                if not user:
-                    raise Exception("User not found")
-
-                # # 계정 활성화
-                # res = self.okta_client.add_user_to_group(group_id=OktaGroups.O365_INTUNE, user_id=user.okta_user_id)
-                # if not res.ok:
-                #     raise Exception(res.error or "Intune group assignment failed")
-
-                # 성공 시
-                self._mark_quick_action_done(action=quick_action)
-            except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
-            finally:
-                setting.save()
-
-        return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
-
-    def okta_activate(self, setting_ids: List[str], requested_by: str = None):
+    def okta_activate(self, setting_ids: List[str], requested_by: str = None, on_progress: ProgressCallback = None):
         """
         사용자 Okta 계정 활성화
         """
-        fail_user_name = []
+        def execute(setting: Setting, user: Employee):
+            # 계정 활성화
+            # res = self.okta_client.activate_user(user_id=user.okta_user_id)
+            # if not res.ok:
+            #     raise Exception(res.error or "Okta activation failed")
+            pass
+
+        return self._run_quick_action('okta-activate', setting_ids, requested_by, execute, on_progress)
+
+    def _run_quick_action(
+            self,
+            action_name: str,
+            setting_ids: List[str],
+            requested_by: Optional[str],
+            execute: Callable[[Setting, Employee], None],
+            on_progress: ProgressCallback = None
+    ) -> Dict[str, Any]:
+        """
+        빠른 실행 공통 흐름
+        - 대상 Setting / Employee를 각각 한 번의 쿼리로 미리 조회
+        - 실행 가능 여부 확인 -> progress -> execute -> done / error
+        - execute(외부 API 호출)는 max_workers 크기의 스레드 풀에서 동시에 실행
+        :param action_name: 예. 'okta-setting'
+        :param execute: 사용자별 외부 작업 (실패 시 예외 발생)
+        :param on_progress: Setting별 상태가 바뀔 때 호출 (setting_id, status, error_message)
+        """
+        notify = on_progress or (lambda *args: None)
         is_single = len(setting_ids) == 1
 
-        for setting_id in setting_ids:
-            setting = Setting.objects(id=setting_id).first()
+        settings = self._prefetch_settings(setting_ids)
+        users = self._prefetch_employees(settings.values())
+
+        targets = []
+        failed_ids = set()
+        changed = False
+
+        for setting_id in dict.fromkeys(setting_ids):
+            setting = settings.get(setting_id)
             if not setting:
+                notify(setting_id, QuickActionStatus.ERROR, "Setting not found")
                 continue
 
-            quick_action = self._get_quick_action(setting, 'okta-activate')
+            quick_action = self._get_quick_action(setting, action_name)
             status = quick_action.status
 
             # 실행 가능 여부 확인
             if not self._is_executable(status=status, is_single=is_single):
                 # n/a일 경우: 상태 유지 + 에러 메시지만 기록
                 if status == QuickActionStatus.NA:
-                    quick_action.error_message = "Action not applicable for this setting"
-                    setting.save()
-                fail_user_name.append(setting.user_name)
+                    changed = self._update_quick_action(
+                        setting=setting,
+                        action=quick_action,
+                        error_message="Action not applicable for this setting"
+                    ) or changed
+                failed_ids.add(setting_id)
+                notify(
+                    setting_id,
+                    QuickActionStatus.ERROR,
+                    quick_action.error_message if status == QuickActionStatus.NA else f"Action not executable (status: {status.value})"
+                )
                 continue
 
             # 실행 시작 - progress
-            self._mark_quick_action_progress(
+            changed = self._mark_quick_action_progress(
+                setting=setting,
                 action=quick_action,
                 requested_by=requested_by,
-            )
-            setting.save()
+            ) or changed
+            notify(setting_id, QuickActionStatus.PROGRESS, None)
+
+            targets.append((setting_id, setting, quick_action))
 
+        # 컬렉션 버전(ETag)은 상태 변경마다가 아니라 progress 반영 후 / 실행 완료 후 한 번씩만 올림
+        # (중간 상태를 본 클라이언트는 마지막 bump로 다시 조회하게 됨)
+        if changed:
+            CollectionVersionService.bump(Setting._get_collection_name())
+
+        def run(target) -> bool:
+            setting_id, setting, quick_action = target
             try:
-                user = Employee.objects(email=setting.user_email).first()
+                user = users.get(setting.user_email)
                 if not user:
                     raise Exception("User not found")
 
-                # 계정 활성화
-                # res = self.okta_client.activate_user(user_id=user.okta_user_id)
-                # if not res.ok:
-                #     raise Exception(res.error or "Okta activation failed")
+                execute(setting, user)
 
                 # 성공 시
-                self._mark_quick_action_done(action=quick_action)
+                self._mark_quick_action_done(setting=setting, action=quick_action)
+                return True
             except Exception as e:
-                self._mark_quick_action_error(action=quick_action, error_message=str(e))
-                fail_user_name.append(setting.user_name)
+                self._mark_quick_action_error(setting=setting, action=quick_action, error_message=str(e))
+                return False
             finally:
-                setting.save()
+                notify(setting_id, quick_action.status, quick_action.error_message)
+
+        workers = min(self.max_workers, len(targets))
+        if workers <= 1:
+            succeeded = [run(target) for target in targets]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"quick-action-{action_name}") as pool:
+                # 워커 스레드는 요청의 ContextVar를 물려받지 않으므로 작업마다 복사해 실행 (X-Mongo-Query-Count 집계 등)
+                futures = [pool.submit(contextvars.copy_context().run, run, target) for target in targets]
+                succeeded = [future.result() for future in futures]
+
+        if targets:
+            CollectionVersionService.bump(Setting._get_collection_name())
+
+        for (setting_id, _, _), ok in zip(targets, succeeded):
+            if not ok:
+                failed_ids.add(setting_id)
+
+        # 요청 순서대로 실패 사용자 기록
+        fail_user_name = [
+            settings[setting_id].user_name
+            for setting_id in dict.fromkeys(setting_ids)
+            if setting_id in failed_ids
+        ]
 
         return {"failed_users": fail_user_name, "failed_count": len(fail_user_name), "success_count": len(setting_ids) - len(fail_user_name)}
 
+    @staticmethod
+    def _prefetch_settings(setting_ids: List[str]) -> Dict[str, Setting]:
+        """
+        대상 Setting을 id__in 쿼리 한 번으로 조회
+        :return: {setting_id: Setting}
+        """
+        if not setting_ids:
+            return {}
+        return {
+            str(setting.id): setting
+            for setting in Setting.objects(id__in=list(set(setting_ids)))
+        }
+
+    @staticmethod
+    def _prefetch_employees(settings) -> Dict[str, Employee]:
+        """
+        대상 사용자 조회 - 캐시에 없는 사용자만 email__in 쿼리 한 번으로 조회
+        :return: {email: Employee}
+        """
+        return employee_cache.get_many_by_email(setting.user_email for setting in settings)
+
     def _is_executable(self, status: QuickActionStatus, is_single: bool) -> bool:
         """
         실행 가능 여부 판단 함수
@@ -506,19 +519,125 @@ class SettingService(CrudBase):
                 return action
         return None
 
-    def _mark_quick_action_progress(self, action: QuickAction, requested_by: str):
-        action.requested_by = requested_by
-        action.requested_at = datetime.utcnow()
-        action.status = QuickActionStatus.PROGRESS
-        action.error_message = None
+    def _mark_quick_action_progress(self, setting: Setting, action: QuickAction, requested_by: str) -> bool:
+        return self._update_quick_action(
+            setting=setting,
+            action=action,
+            requested_by=requested_by,
+            requested_at=datetime.utcnow(),
+            status=QuickActionStatus.PROGRESS,
+            error_message=None
+        )
+
+    def _mark_quick_action_done(self, setting: Setting, action: QuickAction) -> bool:
+        return self._update_quick_action(
+            setting=setting,
+            action=action,
+            status=QuickActionStatus.DONE,
+            error_message=None
+        )
+
+    def _mark_quick_action_error(self, setting: Setting, action: QuickAction, error_message: str) -> bool:
+        return self._update_quick_action(
+            setting=setting,
+            action=action,
+            status=QuickActionStatus.ERROR,
+            error_message=error_message
+        )
+
+    @staticmethod
+    def _update_quick_action(setting: Setting, action: QuickAction, **fields) -> bool:
+        """
+        quick_actions 배열에서 action 이름이 일치하는 항목만 $set으로 갱신
+        - 문서 전체를 다시 쓰지 않으므로 같은 Setting의 다른 액션 / 필드 변경을 덮어쓰지 않음
+        - 메모리의 action 객체도 같은 값으로 맞춰 둠
+        - 컬렉션 버전은 호출하는 쪽(_run_quick_action)에서 묶어서 올림
+        :return: 갱신된 문서가 있는지 (없으면 요약 / 이벤트도 반영하지 않음)
+        """
+        previous_status = action.status
+        for key, value in fields.items():
+            setattr(action, key, value)
+
+        updated = Setting.objects(id=setting.id, quick_actions__action=action.action).update_one(**{
+            f"set__quick_actions__S__{key}": value for key, value in fields.items()
+        })
+        if not updated:
+            return False
+
+        if "status" in fields and fields["status"] != previous_status:
+            SettingSummaryService.increment({
+                f"quick_actions.{action.action}.{QuickActionStatus(previous_status).value}": -1,
+                f"quick_actions.{action.action}.{QuickActionStatus(fields['status']).value}": 1,
+            })
+        publish_local(EventType.QUICK_ACTION, str(setting.id), {"action": action.action, **fields})
+        return True
+
+    @classmethod
+    def stats(cls, filters: Optional[Dict[str, Any]] = None, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        대시보드 집계 (aggregate $facet 한 번)
+        - status / company / onboarding_type / urgency별 건수, 마감일이 지난 미완료 건수, 전체 건수
+        - 값이 없는 항목도 0으로 채워 반환
+        :param filters: MongoEngine 필터 (GET /settings와 같은 조건)
+        """
+        now = now or datetime.utcnow()
+
+        def count_by(field: str):
+            return [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+
+        pipeline = [{
+            "$facet": {
+                "status": count_by("status"),
+                "company": count_by("company"),
+                "onboarding_type": count_by("onboarding_type"),
+                "urgency": count_by("urgency"),
+                "overdue": [
+                    {"$match": {"due_date": {"$lt": now}, "status": {"$ne": SettingStatus.COMPLETED.value}}},
+                    {"$count": "count"},
+                ],
+                "total": [{"$count": "count"}],
+            }
+        }]
+
+        facets = next(iter(cls.model.objects(**(filters or {})).aggregate(pipeline)), {})
+
+        def counts(name: str, values) -> Dict[str, int]:
+            result = {value: 0 for value in values}
+            for row in facets.get(name, []):
+                if row["_id"] is not None:
+                    result[row["_id"]] = row["count"]
+            return result
+
+        urgency = {row["_id"]: row["count"] for row in facets.get("urgency", [])}
 
-    def _mark_quick_action_done(self, action: QuickAction):
-        action.status = QuickActionStatus.DONE
-        action.error_message = None
+        return {
+            "total": facets["total"][0]["count"] if facets.get("total") else 0,
+            "status": counts("status", [status.value for status in SettingStatus]),
+            "company": counts("company", [company.value for company in Company]),
+            "onboarding_type": counts("onboarding_type", [onboarding_type.value for onboarding_type in OnboardingType]),
+            "urgency": {"urgent": urgency.get(True, 0), "normal": urgency.get(False, 0)},
+            "overdue": facets["overdue"][0]["count"] if facets.get("overdue") else 0,
+        }
 
-    def _mark_quick_action_error(self, action: QuickAction, error_message: str):
-        action.status = QuickActionStatus.ERROR
-        action.error_message = error_message
+    @classmethod
+    def version(cls) -> int:
+        """
+        Setting 컬렉션 현재 버전 (GET /settings ETag)
+        """
+        return CollectionVersionService.get(cls.model._get_collection_name())
+
+    @classmethod
+    def _after_write(cls, action: str, doc_id: str, data: Optional[Dict[str, Any]] = None):
+        """
+        컬렉션 버전 증가 (GET /settings ETag) + 변경 이벤트 발행 (GET /settings/stream)
+        """
+        CollectionVersionService.bump(cls.model._get_collection_name())
+        if action == "created":
+            publish_local(EventType.CREATED, doc_id, data)
+        elif action == "updated":
+            publish_local(EventType.UPDATED, doc_id, {"updated_fields": data})
+        elif action == "deleted":
+            publish_local(EventType.DELETED, doc_id)
 
     @staticmethod
     def generate_quick_actions(
@@ -0,0 +1,318 @@
+import asyncio
+import os
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from pymongo.errors import OperationFailure, PyMongoError
+from common.serializers import to_json_safe
+from models.setting import Setting
+
+
+# 이벤트 발행 방식
+# - auto: change stream을 쓸 수 있으면 change_stream, 아니면 local (기본값)
+# - local: SettingService 쓰기 경로에서 직접 발행 (이 프로세스의 변경만 전달)
+# - change_stream: MongoDB change stream 구독 (다른 worker / Airflow 등 다른 프로세스 변경 포함, replica set 필요)
+SETTING_EVENT_SOURCE = os.getenv("SETTING_EVENT_SOURCE", "auto").lower()
+
+# 구독자별 대기열 크기 (가득 차면 해당 구독자에게 resync 이벤트를 보내고 연결 종료)
+SUBSCRIBER_QUEUE_SIZE = 1000
+# 재연결(Last-Event-ID) 시 다시 보내줄 최근 이벤트 수
+REPLAY_BUFFER_SIZE = 1000
+
+# resume token으로 이어서 구독할 수 없는 경우의 오류 코드 (ChangeStreamHistoryLost, ChangeStreamFatalError)
+RESUME_LOST_CODES = {280, 286}
+
+
+class EventType:
+    """
+    data 형식
+    - created: Setting 문서 전체
+    - updated: {"updated_fields": {...}} (change stream은 removed_fields 포함, replace는 {"document": {...}})
+    - quick_action: {"action": 액션 이름, 변경된 필드...} (change stream에서는 updated로 전달됨)
+    """
+    CREATED = "setting.created"
+    UPDATED = "setting.updated"
+    DELETED = "setting.deleted"
+    QUICK_ACTION = "quick_action.updated"
+    # 개별 변경을 알 수 없는 경우 (동기화, 대기열 초과 등) - 클라이언트는 목록을 다시 조회
+    RESYNC = "settings.resync"
+
+
+class Subscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def deliver(self, event: Dict[str, Any]):
+        """
+        구독자의 이벤트 루프에서 실행
+        """
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class SettingEventBus:
+    """
+    Setting 변경 이벤트 in-process pub/sub
+    - publish()는 어느 스레드에서나 호출 가능 (요청 스레드 풀, 빠른 실행 워커 등)
+    - 구독자는 asyncio.Queue로 이벤트를 받음 (GET /settings/stream)
+    - 이벤트마다 증가하는 seq를 붙이고 최근 이벤트를 보관해 재연결 시 놓친 이벤트를 다시 전달
+    - SSE id는 "<epoch>-<seq>" (epoch는 프로세스마다 새로 발급)
+      재시작한 프로세스 / 다른 worker로 재연결하면 epoch가 달라 resync 이벤트를 보냄
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.epoch = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._subscribers: Set[Subscription] = set()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=REPLAY_BUFFER_SIZE)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        이벤트 루프 안에서 호출
+        :param last_event_id: 클라이언트가 마지막으로 받은 SSE id (Last-Event-ID)
+        """
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+            if last_event_id is not None:
+                for event in self._replay(last_event_id):
+                    subscription.deliver(event)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event_type: str, setting_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        with self._lock:
+            self._seq += 1
+            event = {
+                "event_id": f"{self.epoch}-{self._seq}",
+                "seq": self._seq,
+                "type": event_type,
+                "id": setting_id,
+                "data": to_json_safe(data) if data else None,
+                "at": datetime.utcnow().isoformat(),
+            }
+            self._recent.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자
+                self.unsubscribe(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _replay(self, last_event_id: str) -> List[Dict[str, Any]]:
+        """
+        lock을 잡은 상태에서 호출
+        - 다른 프로세스(재시작 전 / 다른 worker)의 id거나 보관 범위를 벗어난 seq면 resync 이벤트 하나만 반환
+        """
+        epoch, _, seq = last_event_id.partition("-")
+        last_seq = int(seq) if epoch == self.epoch and seq.isdigit() else None
+
+        if last_seq == self._seq:
+            return []
+        if last_seq is None or last_seq > self._seq or not self._recent or last_seq < self._recent[0]["seq"] - 1:
+            return [{"event_id": f"{self.epoch}-{self._seq}", "seq": self._seq, "type": EventType.RESYNC,
+                     "id": None, "data": None, "at": datetime.utcnow().isoformat()}]
+        return [event for event in self._recent if event["seq"] > last_seq]
+
+
+setting_events = SettingEventBus()
+
+
+def publish_local(event_type: str, setting_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+    """
+    SettingService 쓰기 경로에서 호출 - change stream 사용 중이면 중복 발행하지 않음
+    """
+    if setting_change_stream.active:
+        return
+    setting_events.publish(event_type, setting_id, data)
+
+
+class SettingChangeStream:
+    """
+    Setting 컬렉션 change stream
+    - 별도 스레드에서 watch()를 돌며 변경을 listener에 전달 (SettingEventBus, SettingHotView)
+    - replica set이 아니어서 change stream을 쓸 수 없으면 시작하지 않음
+    - 연결이 끊기면 on_down 호출 후 resume token으로 이어서 구독
+      (resume token은 변경이 없어도 pymongo가 갱신하는 stream.resume_token 사용)
+    - stream을 (다시) 열 때마다 on_reset 호출 - 끊긴 동안의 변경을 놓쳤을 수 있으므로
+      (on_reset에서 전체를 다시 읽으면 그 이후 변경은 stream으로 이어서 받음)
+    """
+
+    def __init__(self):
+        self.active = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stream = None
+        self._listeners: List[Tuple[
+            Callable[[Dict[str, Any]], None], Optional[Callable[[], None]], Optional[Callable[[], None]]
+        ]] = []
+
+    def add_listener(
+            self,
+            on_change: Callable[[Dict[str, Any]], None],
+            on_reset: Optional[Callable[[], None]] = None,
+            on_down: Optional[Callable[[], None]] = None,
+    ):
+        """
+        start() 전에 등록
+        :param on_change: change 이벤트 원본(dict)을 받는 함수
+        :param on_reset: 놓친 변경이 있을 수 있어 전체를 다시 읽어야 할 때 호출
+        :param on_down: stream이 끊겨 변경을 받을 수 없게 되었을 때 호출 (다시 열리면 on_reset)
+        """
+        self._listeners.append((on_change, on_reset, on_down))
+
+    def start(self) -> bool:
+        if self._thread is not None:
+            return self.active
+
+        collection = Setting._get_collection()
+        try:
+            # replica set 여부 확인 (standalone이면 OperationFailure)
+            self._stream = collection.watch(full_document="updateLookup")
+        except PyMongoError as e:
+            print(f"Setting change stream unavailable: {e}")
+            return False
+
+        self.active = True
+        self._thread = threading.Thread(target=self._run, name="setting-change-stream", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        if self._stream is not None:
+            self._stream.close()
+        self.active = False
+        self._notify_down()
+
+    def _run(self):
+        collection = Setting._get_collection()
+        resume_token = None
+        reset = True
+
+        while not self._stop.is_set():
+            try:
+                if self._stream is None:
+                    self._stream = collection.watch(full_document="updateLookup", resume_after=resume_token)
+                if reset:
+                    self._reset()
+                    reset = False
+                for change in self._stream:
+                    self._dispatch(change)
+
+                # invalidate(컬렉션 drop / rename 등)로 stream이 닫힘 - 새로 구독 후 전체 재조회
+                self._stream = None
+                resume_token = None
+                reset = True
+                self._notify_down()
+            except PyMongoError as e:
+                if self._stop.is_set():
+                    break
+                print(f"Setting change stream error: {e}")
+                if self._stream is not None:
+                    # 마지막으로 받은 batch 기준 token (변경이 없었어도 postBatchResumeToken으로 갱신됨)
+                    resume_token = self._stream.resume_token or resume_token
+                    self._stream.close()
+                self._stream = None
+                if isinstance(e, OperationFailure) and e.code in RESUME_LOST_CODES:
+                    # resume token이 oplog에서 사라짐 - 처음부터 새로 구독
+                    resume_token = None
+                # 끊긴 동안 listener가 오래된 데이터를 쓰지 않도록 알리고, 다시 열면 전체 재조회
+                reset = True
+                self._notify_down()
+                self._stop.wait(1)
+
+    def _dispatch(self, change: Dict[str, Any]):
+        for on_change, _, _ in self._listeners:
+            try:
+                on_change(change)
+            except Exception as e:
+                print(f"Setting change listener error: {e}")
+
+    def _reset(self):
+        for _, on_reset, _ in self._listeners:
+            if on_reset is None:
+                continue
+            try:
+                on_reset()
+            except Exception as e:
+                print(f"Setting change reset error: {e}")
+
+    def _notify_down(self):
+        for _, _, on_down in self._listeners:
+            if on_down is None:
+                continue
+            try:
+                on_down()
+            except Exception as e:
+                print(f"Setting change down error: {e}")
+
+
+def _publish_change(change: Dict[str, Any]):
+    """
+    change stream 이벤트 -> SettingEventBus
+    """
+    operation = change["operationType"]
+    setting_id = str(change["documentKey"]["_id"]) if "documentKey" in change else None
+
+    if operation == "insert":
+        setting_events.publish(EventType.CREATED, setting_id, _document(change))
+    elif operation in ("update", "replace"):
+        description = change.get("updateDescription") or {}
+        data = {
+            "updated_fields": description.get("updatedFields", {}),
+            "removed_fields": description.get("removedFields", []),
+        } if operation == "update" else {"document": _document(change)}
+        setting_events.publish(EventType.UPDATED, setting_id, data)
+    elif operation == "delete":
+        setting_events.publish(EventType.DELETED, setting_id)
+    elif operation in ("drop", "rename", "invalidate"):
+        setting_events.publish(EventType.RESYNC)
+
+
+def _document(change: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    document = change.get("fullDocument")
+    if not document:
+        return None
+    document = dict(document)
+    document["id"] = document.pop("_id")
+    return document
+
+
+setting_change_stream = SettingChangeStream()
+setting_change_stream.add_listener(_publish_change, lambda: setting_events.publish(EventType.RESYNC))
+
+
+def start_event_source(force: bool = False) -> str:
+    """
+    lifespan에서 호출
+    - local로 지정하지 않았으면 change stream을 먼저 시도하고, 쓸 수 없으면(standalone 등) local로 동작
+    :param force: SETTING_EVENT_SOURCE와 관계없이 change stream 사용 (hot view 등 다른 listener가 필요로 할 때)
+    :return: 실제 사용 중인 이벤트 발행 방식
+    """
+    if (force or SETTING_EVENT_SOURCE != "local") and setting_change_stream.start():
+        return "change_stream"
+    return "local"
+
+
+def stop_event_source():
+    setting_change_stream.stop()
@@ -0,0 +1,119 @@
+from collections import Counter
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Mapping, Optional
+from models.setting import Setting
+from models.setting_summary import SettingSummary
+
+
+SUMMARY_NAME = "setting"
+
+# 요약에 포함하는 Setting 필드
+SUMMARY_FIELDS = ("status", "company", "onboarding_type")
+
+
+class SettingSummaryService:
+    """
+    Setting 건수 요약 문서 관리
+    - 쓰기 경로는 변경 전 / 후 문서로 apply()를 호출해 차이만 $inc로 반영 (업데이트 1회)
+    - 변경 전 값은 각 쓰기 경로가 미리 읽은 값을 사용하므로 동시에 같은 문서를 바꾸면 어긋날 수 있음
+      -> rebuild()로 전체 재계산 (Airflow 일 1회 / POST /settings/summary/rebuild)
+    """
+
+    @staticmethod
+    def contribution(doc: Mapping[str, Any]) -> Counter:
+        """
+        문서 하나가 요약에 더하는 값
+        :param doc: PyMongo 형식 Setting 문서 (to_mongo() / as_pymongo() / $set 문서 병합 결과)
+        """
+        counter = Counter({"total": 1})
+        for field in SUMMARY_FIELDS:
+            value = _value(doc.get(field))
+            if value is not None:
+                counter[f"{field}.{value}"] += 1
+
+        for action in doc.get("quick_actions") or []:
+            name = action.get("action")
+            status = _value(action.get("status"))
+            if name and status:
+                counter[f"quick_actions.{name}.{status}"] += 1
+
+        return counter
+
+    @classmethod
+    def apply(cls, added: Iterable[Mapping[str, Any]] = (), removed: Iterable[Mapping[str, Any]] = ()):
+        """
+        추가된 문서(변경 후)는 더하고 삭제된 문서(변경 전)는 빼서 한 번의 $inc로 반영
+        """
+        delta = Counter()
+        for doc in added:
+            delta.update(cls.contribution(doc))
+        for doc in removed:
+            delta.subtract(cls.contribution(doc))
+
+        cls.increment({key: count for key, count in delta.items() if count})
+
+    @staticmethod
+    def increment(delta: Dict[str, int]):
+        if not delta:
+            return
+        SettingSummary._get_collection().update_one(
+            {"_id": SUMMARY_NAME},
+            {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    @staticmethod
+    def get() -> Optional[Dict[str, Any]]:
+        doc = SettingSummary.objects(name=SUMMARY_NAME).as_pymongo().first()
+        if not doc:
+            return None
+        doc.pop("_id", None)
+        return doc
+
+    @classmethod
+    def rebuild(cls) -> Dict[str, Any]:
+        """
+        Setting 컬렉션 전체를 다시 집계해 요약 문서를 교체
+        """
+        def count_by(field: str):
+            return [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+
+        facets = next(iter(Setting.objects.aggregate([{
+            "$facet": {
+                "total": [{"$count": "count"}],
+                **{field: count_by(field) for field in SUMMARY_FIELDS},
+                "quick_actions": [
+                    {"$unwind": "$quick_actions"},
+                    {"$group": {
+                        "_id": {"action": "$quick_actions.action", "status": "$quick_actions.status"},
+                        "count": {"$sum": 1}
+                    }},
+                ],
+            }
+        }])), {})
+
+        summary = {
+            "total": facets["total"][0]["count"] if facets.get("total") else 0,
+            **{
+                field: {row["_id"]: row["count"] for row in facets.get(field, []) if row["_id"] is not None}
+                for field in SUMMARY_FIELDS
+            },
+            "quick_actions": {},
+        }
+        for row in facets.get("quick_actions", []):
+            action, status = row["_id"].get("action"), row["_id"].get("status")
+            if action and status:
+                summary["quick_actions"].setdefault(action, {})[status] = row["count"]
+
+        now = datetime.utcnow()
+        SettingSummary._get_collection().replace_one(
+            {"_id": SUMMARY_NAME},
+            {**summary, "updated_at": now, "rebuilt_at": now},
+            upsert=True
+        )
+        return cls.get()
+
+
+def _value(value):
+    return value.value if isinstance(value, Enum) else value
@@ -0,0 +1,226 @@
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from common.serializers import serialize_bson
+from models.setting import Setting
+from schemas.setting import SettingListQuery
+from services.collection_version import CollectionVersionService
+from services.setting_events import setting_change_stream
+
+
+# API 프로세스마다 Setting 전체를 메모리에 두고 change stream으로 갱신할지 여부 (replica set 필요)
+SETTING_HOT_VIEW = os.getenv("SETTING_HOT_VIEW", "false").lower() == "true"
+
+# 마지막 쓰기 후 이 시간 동안은 MongoDB에서 조회 (change stream 반영 전 자신이 쓴 값을 다시 읽는 경우 대비)
+# - 쓰기 시각은 CollectionVersion.updated_at이므로 다른 worker / Airflow의 쓰기도 포함
+SETTING_HOT_VIEW_WRITE_GRACE_SECONDS = float(os.getenv("SETTING_HOT_VIEW_WRITE_GRACE_SECONDS", "3"))
+
+# 값별 id 목록을 유지하는 필드 (목록 필터용)
+INDEXED_FIELDS = ("status", "company", "onboarding_type")
+
+
+class SettingHotView:
+    """
+    Setting 컬렉션 in-memory 복제본
+    - change stream을 연 뒤 전체를 한 번 읽고(load), 이후 변경은 fullDocument로 반영
+    - resume token이 만료되면 change stream이 새로 구독한 뒤 다시 전체를 읽음
+    - ready가 아니면(시작 전 / 로드 중 / change stream 끊김 / 사용 불가) 호출하는 쪽에서 MongoDB 조회
+    - 최근 쓰기가 있었으면(serving() False) view가 따라잡기 전이므로 MongoDB 조회
+    - 문서는 (PyMongo 원본, 직렬화 결과) 쌍으로 보관: 필터 / 정렬은 원본, 응답은 직렬화 결과 사용
+    - ETag는 CollectionVersion이 아닌 view에 반영된 상태(epoch, version)로 계산
+      (CollectionVersion은 쓰기 직후 올라가지만 view는 change stream으로 나중에 따라오므로)
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.loaded_at: Optional[datetime] = None
+        # 반영된 변경 수 (load / _put / _remove마다 증가), epoch는 load마다 새로 발급 - 프로세스 간 구분
+        self.version = 0
+        self.epoch = ""
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._serialized: Dict[str, Dict[str, Any]] = {}
+        self._index: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in INDEXED_FIELDS}
+
+    def load(self):
+        """
+        전체 다시 읽기 (change stream의 on_reset)
+        """
+        self.ready = False
+        docs = list(Setting.objects.as_pymongo())
+
+        with self._lock:
+            self._docs.clear()
+            self._serialized.clear()
+            for values in self._index.values():
+                values.clear()
+            for doc in docs:
+                self._put(doc)
+            self.epoch = uuid.uuid4().hex[:8]
+            self.version += 1
+            self.loaded_at = datetime.utcnow()
+            self.ready = True
+
+    def invalidate(self):
+        """
+        change stream이 끊김 (change stream의 on_down) - 다시 열려 load할 때까지 MongoDB 조회
+        """
+        self.ready = False
+
+    def serving(self) -> bool:
+        """
+        요청을 view에서 처리할지 여부 (ready이고 최근 쓰기가 없을 때)
+        """
+        if not self.ready:
+            return False
+        updated_at = CollectionVersionService.get_updated_at(Setting._get_collection_name())
+        return updated_at is None or (datetime.utcnow() - updated_at).total_seconds() >= SETTING_HOT_VIEW_WRITE_GRACE_SECONDS
+
+    def apply(self, change: Dict[str, Any]):
+        """
+        change stream 이벤트 반영 (change stream의 on_change)
+        """
+        operation = change["operationType"]
+
+        if operation in ("insert", "update", "replace"):
+            document = change.get("fullDocument")
+            # updateLookup 시점에 이미 삭제된 문서는 뒤따르는 delete 이벤트로 처리
+            if document:
+                with self._lock:
+                    self._put(document)
+        elif operation == "delete":
+            with self._lock:
+                self._remove(str(change["documentKey"]["_id"]))
+        elif operation in ("drop", "rename", "invalidate"):
+            with self._lock:
+                self.ready = False
+
+    def etag_state(self) -> Tuple[int, str]:
+        """
+        데이터보다 먼저 읽을 것 (사이에 변경이 있으면 다음 요청에서 다시 조회됨)
+        :return: (version, epoch)
+        """
+        with self._lock:
+            return self.version, self.epoch
+
+    def get(self, setting_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._serialized.get(setting_id)
+
+    def list(self, query: SettingListQuery, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        SettingService.list(filters=query.to_filters(), order_by=query.order_by)와 같은 결과
+        """
+        with self._lock:
+            ids = self._candidates(query)
+            docs = [self._docs[setting_id] for setting_id in ids]
+            docs = [doc for doc in docs if _matches(doc, query)]
+
+            descending = query.order_by.startswith("-")
+            sort_field = query.order_by.lstrip("+-")
+            # MongoDB와 같이 null(누락 포함)을 가장 작은 값으로 정렬, 같은 값은 정렬 방향과 관계없이 _id 순 (stable sort)
+            docs.sort(key=lambda doc: doc["_id"])
+            docs.sort(
+                key=lambda doc: (doc.get(sort_field) is not None, doc.get(sort_field) or 0),
+                reverse=descending
+            )
+
+            items = [self._serialized[str(doc["_id"])] for doc in docs]
+
+        if fields:
+            return [{k: v for k, v in item.items() if k == "id" or k in fields} for item in items]
+        return list(items)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": SETTING_HOT_VIEW,
+                "ready": self.ready,
+                "size": len(self._docs),
+                "version": self.version,
+                "loaded_at": self.loaded_at,
+            }
+
+    def _candidates(self, query: SettingListQuery) -> Iterable[str]:
+        """
+        인덱스 필드 조건으로 후보 id를 좁힘
+        """
+        candidates: Optional[Set[str]] = None
+        for field in INDEXED_FIELDS:
+            values = getattr(query, field)
+            if not values:
+                continue
+            ids = set()
+            for value in values:
+                ids |= self._index[field].get(value, set())
+            candidates = ids if candidates is None else candidates & ids
+
+        return self._docs.keys() if candidates is None else candidates
+
+    def _put(self, doc: Dict[str, Any]):
+        setting_id = str(doc["_id"])
+        self._remove(setting_id)
+        self._docs[setting_id] = doc
+        self._serialized[setting_id] = serialize_bson(doc)
+        for field in INDEXED_FIELDS:
+            self._index[field].setdefault(doc.get(field), set()).add(setting_id)
+        self.version += 1
+
+    def _remove(self, setting_id: str):
+        doc = self._docs.pop(setting_id, None)
+        if doc is None:
+            return
+        self._serialized.pop(setting_id, None)
+        for field in INDEXED_FIELDS:
+            ids = self._index[field].get(doc.get(field))
+            if ids:
+                ids.discard(setting_id)
+        self.version += 1
+
+
+def _matches(doc: Dict[str, Any], query: SettingListQuery) -> bool:
+    if query.urgency is not None and doc.get("urgency", False) != query.urgency:
+        return False
+    if query.assignee_name and doc.get("assignee_name") != query.assignee_name:
+        return False
+
+    for field in ("requested_date", "due_date"):
+        start = _utc(getattr(query, f"{field}_from"))
+        end = _utc(getattr(query, f"{field}_to"))
+        if not start and not end:
+            continue
+        value = doc.get(field)
+        if value is None:
+            return False
+        if start and value < start:
+            return False
+        if end and value > end:
+            return False
+
+    return True
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    MongoDB에는 naive UTC로 저장되므로 비교 전에 맞춤
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+setting_view = SettingHotView()
+
+
+def start_hot_view() -> bool:
+    """
+    lifespan에서 start_event_source 전에 호출 (SETTING_HOT_VIEW가 켜져 있을 때만)
+    - 실제 로드는 change stream 스레드가 stream을 연 직후 수행
+    """
+    if not SETTING_HOT_VIEW:
+        return False
+
+    setting_change_stream.add_listener(setting_view.apply, setting_view.load, setting_view.invalidate)
+    return True
@@ -5,10 +5,10 @@ from common.slack_blocks import get_mrkdwn_block
 from blocks.setting import pickup_notice_modal_view, pickup_reserve_message_block, password_check_modal_view
 
 # @slack_app.action("open_pickup_modal")
-def open_pickup_modal(ack, body, client):
-    ack()
+async def open_pickup_modal(ack, body, client):
+    await ack()
     try:
-        client.views_open(
+        await client.views_open(
             trigger_id=body["trigger_id"],
             view=pickup_notice_modal_view(channel_id=body["channel"]["id"], message_ts=body["message"]["ts"])
         )
@@ -16,8 +16,8 @@ def open_pickup_modal(ack, body, client):
         print(f"Slack error: {e.response['error']}")
 
 # @slack_app.view("pickup_info_submit")
-def handle_pickup_submission(ack, body, client):
-    ack()
+async def handle_pickup_submission(ack, body, client):
+    await ack()
 
     user_slack_id = body.get("user", {}).get("id", "")
 
@@ -31,14 +31,14 @@ def handle_pickup_submission(ack, body, client):
     pickup_disk = values.get("backup_disk_block", {}).get("backup_disk", {}).get("selected_option", {}).get("text", {}).get("text", "")
     try:
         # 관리자 채널에 확인용 메시지 전송
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=Channels.DEVICE_PICKUP_INFO,
             text="장비 수령 예약 완료",
             blocks=pickup_reserve_message_block(user_slack_id=user_slack_id, pickup_date=pickup_date, pickup_time=pickup_time, backup_disk=pickup_disk)
         )
 
         # 수령자 DM에서 수령 버튼을 확인용 메시지로 수정
-        client.chat_update(
+        await client.chat_update(
             channel=channel_id,
             ts=message_ts,
             text="장비 수령 예약 완료",
@@ -48,11 +48,11 @@ def handle_pickup_submission(ack, body, client):
         print(f"Slack error: {e.response['error']}")
 
 # @slack_app.action("open_password_modal")
-def open_password_modal(ack, body, client):
-    ack()
+async def open_password_modal(ack, body, client):
+    await ack()
     password = body["actions"][0]["value"]
     try:
-        client.views_open(
+        await client.views_open(
             trigger_id=body["trigger_id"],
             view=password_check_modal_view(password)
         )
@@ -0,0 +1,103 @@
+"""
+AsyncOktaClient
+
+- 실제 Okta 대신 httpx.MockTransport로 응답을 만들어 네트워크 없이 실행
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from modules import okta
+from modules.okta import AsyncOktaClient
+
+
+BASE_URL = "https://okta.test/api/v1"
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    # 재시도 대기에 더해지는 jitter 제거 (테스트가 대기 시간만큼 느려지지 않도록)
+    monkeypatch.setattr(okta.random, "uniform", lambda a, b: 0)
+
+
+def run_client(handler, call, **kwargs):
+    async def main():
+        async with AsyncOktaClient(base_url=BASE_URL, transport=httpx.MockTransport(handler), **kwargs) as client:
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+def test_gather_respects_concurrency_limit():
+    in_flight = 0
+    peak = 0
+    paths = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        paths.append(request.url.path)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(204)
+
+    user_ids = [f"user-{index}" for index in range(10)] + ["user-0"]
+    results = run_client(handler, lambda client: client.add_users_to_group("group-1", user_ids, concurrency=3))
+
+    assert peak == 3
+    # 중복 id는 한 번만 호출
+    assert len(paths) == 10
+    assert list(results) == user_ids[:10]
+    assert all(res.ok and res.status_code == 204 for res in results.values())
+
+
+def test_429_is_retried_after_reset_for_post():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": str(time.time())})
+        return httpx.Response(200, json={"activationUrl": "https://okta.test/activate"})
+
+    res = run_client(handler, lambda client: client.activate_user("user-1"))
+
+    # POST라도 429는 처리되지 않은 요청이므로 재시도
+    assert calls == ["POST", "POST"]
+    assert res.ok and res.retries == 1
+    assert res.data == {"activationUrl": "https://okta.test/activate"}
+
+
+def test_5xx_on_post_is_not_retried():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503, text="unavailable")
+
+    res = run_client(handler, lambda client: client.activate_user("user-1"))
+
+    assert calls == ["POST"]
+    assert not res.ok
+    assert res.status_code == 503
+
+
+def test_429_gives_up_after_max_retries_with_malformed_headers(monkeypatch):
+    monkeypatch.setattr(okta, "OKTA_MAX_RETRIES", 2)
+    monkeypatch.setattr(okta.OktaClientBase, "_backoff", staticmethod(lambda retries: 0))
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(429, headers={"X-Rate-Limit-Remaining": "n/a", "X-Rate-Limit-Reset": "soon"})
+
+    res = run_client(handler, lambda client: client.add_user_to_group("group-1", "user-1"))
+
+    # 헤더 형식이 잘못되어도 backoff로 재시도하고, 상한에 도달하면 429 실패 반환
+    assert len(calls) == 3
+    assert not res.ok
+    assert res.status_code == 429
+    assert res.retries == 2
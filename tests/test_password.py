@@ -0,0 +1,49 @@
+import random
+import threading
+
+from modules import password
+from modules.password import generate_password_for_week
+
+
+THREADS = 16
+CALLS_PER_THREAD = 2000
+
+
+def test_same_password_as_global_seed():
+    # random.seed(cycle_index) 후 생성하던 기존 방식과 같은 비밀번호
+    for cycle_index in range(-5, 200):
+        random.seed(cycle_index)
+        expected = password.generate_custom_password()
+        assert password._password_for_cycle(cycle_index) == expected
+
+
+def test_concurrent_calls_are_stable_and_keep_global_random():
+    password._password_for_cycle.cache_clear()
+    expected = generate_password_for_week()
+
+    random.seed(12345)
+    reference = [random.random() for _ in range(10000)]
+
+    results = set()
+    sequences = []
+    start = threading.Barrier(THREADS + 1)
+
+    def derive():
+        start.wait()
+        values = {generate_password_for_week() for _ in range(CALLS_PER_THREAD)}
+        results.update(values)
+
+    def consume_global_random():
+        start.wait()
+        random.seed(12345)
+        sequences.append([random.random() for _ in range(10000)])
+
+    threads = [threading.Thread(target=derive) for _ in range(THREADS)]
+    threads.append(threading.Thread(target=consume_global_random))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {expected}
+    assert sequences == [reference]
@@ -0,0 +1,226 @@
+"""
+Setting hot view / change stream
+
+- 단위 테스트는 MongoDB 없이 실행 (change 이벤트 / watch cursor를 직접 만들어 전달)
+- 통합 테스트는 로컬 single-node replica set이 있을 때만 실행
+    docker run -d --name mongo-rs -p 27017:27017 mongo:7 --replSet rs0
+    docker exec mongo-rs mongosh --eval 'rs.initiate()'
+    SETTING_TEST_REPLSET_URI="mongodb://localhost:27017/?directConnection=true" python -m pytest -q tests
+"""
+import os
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import PyMongoError
+
+from models.setting import Setting
+from schemas.setting import SettingListQuery
+from services.crud_base import CrudBase
+from services.setting_events import SettingChangeStream
+from services.setting_view import SettingHotView
+
+
+REPLSET_URI = os.getenv("SETTING_TEST_REPLSET_URI")
+
+
+def make_doc(**fields):
+    doc = {
+        "_id": ObjectId(),
+        "user_name": "홍길동",
+        "user_email": "gildong@example.com",
+        "status": "setting",
+        "company": "core",
+        "onboarding_type": "new",
+        "urgency": False,
+        "due_date": None,
+        "created_at": datetime(2026, 1, 1),
+    }
+    doc.update(fields)
+    return doc
+
+
+def loaded_view(*docs) -> SettingHotView:
+    view = SettingHotView()
+    for doc in docs:
+        view.apply({"operationType": "insert", "fullDocument": doc})
+    view.ready = True
+    return view
+
+
+def test_apply_insert_update_delete():
+    first = make_doc(company="core")
+    second = make_doc(company="bank", created_at=datetime(2026, 1, 2))
+    view = loaded_view(first, second)
+
+    assert [item["id"] for item in view.list(SettingListQuery())] == [str(second["_id"]), str(first["_id"])]
+    assert [item["id"] for item in view.list(SettingListQuery(company=["core"]))] == [str(first["_id"])]
+
+    view.apply({"operationType": "update", "fullDocument": {**first, "company": "bank"}})
+    assert view.list(SettingListQuery(company=["core"])) == []
+    assert len(view.list(SettingListQuery(company=["bank"]))) == 2
+
+    view.apply({"operationType": "delete", "documentKey": {"_id": second["_id"]}})
+    assert view.get(str(second["_id"])) is None
+    assert view.get(str(first["_id"]))["company"] == "bank"
+
+
+def test_list_matches_filters_and_null_ordering():
+    early = make_doc(due_date=datetime(2026, 1, 10), urgency=True)
+    late = make_doc(due_date=datetime(2026, 1, 20))
+    missing = make_doc()
+    view = loaded_view(early, late, missing)
+
+    ids = [item["id"] for item in view.list(SettingListQuery(order_by="due_date"))]
+    assert ids == [str(missing["_id"]), str(early["_id"]), str(late["_id"])]
+
+    urgent = view.list(SettingListQuery(urgency=True), fields=["user_name"])
+    assert urgent == [{"user_name": "홍길동", "id": str(early["_id"])}]
+
+    ranged = view.list(SettingListQuery(due_date_from=datetime(2026, 1, 15)))
+    assert [item["id"] for item in ranged] == [str(late["_id"])]
+
+
+def test_etag_state_changes_with_applied_changes():
+    doc = make_doc()
+    view = loaded_view(doc)
+    before = view.etag_state()
+
+    view.apply({"operationType": "update", "fullDocument": {**doc, "status": "completed"}})
+    assert view.etag_state() != before
+
+
+class FakeStream:
+    """
+    pymongo ChangeStream 대신 사용 - events를 순서대로 돌려주고 예외 객체면 발생
+    """
+
+    def __init__(self, events, resume_token=None, stop=None):
+        self.events = events
+        self.resume_token = resume_token
+        self.stop = stop
+
+    def __iter__(self):
+        for event in self.events:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+        self.stop.wait(5)
+
+    def close(self):
+        pass
+
+
+class FakeCollection:
+    def __init__(self, streams):
+        self.streams = iter(streams)
+        self.calls = []
+
+    def watch(self, **kwargs):
+        self.calls.append(kwargs)
+        return next(self.streams)
+
+
+def test_change_stream_reconnect_invalidates_and_resets(monkeypatch):
+    stream = SettingChangeStream()
+    calls = []
+    stream.add_listener(
+        on_change=lambda change: calls.append("change"),
+        on_reset=lambda: calls.append("reset"),
+        on_down=lambda: calls.append("down"),
+    )
+
+    # 변경 없이 끊긴 stream - token은 pymongo가 빈 batch에서도 갱신한 값
+    collection = FakeCollection([
+        FakeStream([PyMongoError("connection reset")], resume_token={"_data": "token-1"}),
+        FakeStream([{"operationType": "delete", "documentKey": {"_id": 1}}], stop=stream._stop),
+    ])
+    monkeypatch.setattr(Setting, "_get_collection", classmethod(lambda cls: collection))
+
+    try:
+        assert stream.start()
+        assert wait_until(lambda: "change" in calls, timeout=5)
+    finally:
+        stream.stop()
+
+    assert collection.calls[1] == {"full_document": "updateLookup", "resume_after": {"_data": "token-1"}}
+    # 처음 reset -> 끊김 -> 다시 열고 reset -> 변경
+    assert calls[:4] == ["reset", "down", "reset", "change"]
+
+
+class SettingCrud(CrudBase):
+    model = Setting
+
+
+@pytest.fixture
+def replset_db():
+    if not REPLSET_URI:
+        pytest.skip("SETTING_TEST_REPLSET_URI not set (local single-node replica set required)")
+
+    from mongoengine import connect, disconnect
+
+    db_name = f"test_setting_view_{uuid.uuid4().hex[:8]}"
+    disconnect()
+    client = connect(db=db_name, host=REPLSET_URI)
+    try:
+        yield
+    finally:
+        client.drop_database(db_name)
+        disconnect()
+
+
+def wait_until(condition, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def new_setting(serial: str, **fields) -> Setting:
+    data = {
+        "user_name": "홍길동",
+        "user_email": f"{serial}@example.com",
+        "role": "team",
+        "os": "Windows",
+        "model": "X1",
+        "serial": serial,
+        "device_type": "EDP001",
+        "network_type": "team",
+        "onboarding_type": "new",
+        "status": "setting",
+        "company": "core",
+    }
+    data.update(fields)
+    return Setting(**data).save()
+
+
+def test_hot_view_follows_replica_set(replset_db):
+    new_setting("S-1")
+
+    view = SettingHotView()
+    stream = SettingChangeStream()
+    stream.add_listener(view.apply, view.load, view.invalidate)
+    assert stream.start()
+
+    try:
+        assert wait_until(lambda: view.ready)
+
+        second = new_setting("S-2", company="bank")
+        first = Setting.objects(serial="S-1").first()
+        Setting.objects(id=first.id).update_one(set__status="completed")
+        new_setting("S-3").delete()
+
+        def same_as_mongo():
+            query = SettingListQuery()
+            expected = SettingCrud.list(filters=query.to_filters(), order_by=query.order_by, raw=True)
+            return view.list(query) == expected
+
+        assert wait_until(same_as_mongo)
+        assert view.get(str(second.id))["company"] == "bank"
+        assert view.get(str(first.id))["status"] == "completed"
+    finally:
+        stream.stop()